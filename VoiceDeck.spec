@@ -13,7 +13,7 @@ hiddenimports = [
     'voicedeck.audio', 'voicedeck.audio.recorder',
     'voicedeck.stt', 'voicedeck.stt.base', 'voicedeck.stt.openai_client',
     'voicedeck.keyring_storage',
-    'scipy.io', 'scipy.io.wavfile', 'numpy',
+    'numpy',
     'platformdirs',
     'keyring.backends',
 ]
@@ -57,8 +57,6 @@ pyinstaller \
     --hidden-import="voicedeck.stt.base" \
     --hidden-import="voicedeck.stt.openai_client" \
     --hidden-import="voicedeck.keyring_storage" \
-    --hidden-import="scipy.io" \
-    --hidden-import="scipy.io.wavfile" \
     --hidden-import="numpy" \
     --hidden-import="keyring.backends" \
     --hidden-import="keyring.backends.SecretService" \
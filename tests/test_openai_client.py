@@ -0,0 +1,87 @@
+"""Tests for the OpenAI transcriber's chunk handling."""
+
+import io
+import wave
+from types import SimpleNamespace
+
+import numpy as np
+
+from voicedeck.config import STTConfig
+from voicedeck.stt.openai_client import OpenAITranscriber, _join_overlapping
+
+
+def test_join_drops_repeat_across_boundary():
+    joined = _join_overlapping(
+        "We reviewed the quarterly numbers with the whole",
+        "With the whole team before lunch.",
+        1.0,
+    )
+    assert joined == "We reviewed the quarterly numbers with the whole team before lunch."
+
+
+def test_join_allows_a_word_cut_off_by_the_edge():
+    joined = _join_overlapping(
+        "and then we reached the mountain cab",
+        "the mountain cabin just after dark.",
+        1.0,
+    )
+    assert joined == "and then we reached the mountain cabin just after dark."
+
+
+def test_join_keeps_unrelated_text_sharing_a_bigram():
+    previous = (
+        "We went over the quarterly numbers for the sales team and discussed "
+        "the onboarding of new hires in the north region before lunch."
+    )
+    current = "After the break we moved on to the budget for the new office."
+    assert _join_overlapping(previous, current, 1.0) == f"{previous} {current}"
+
+
+def test_join_ignores_short_function_word_repeats():
+    previous = "The meeting ended and everyone went home in the"
+    current = "In the morning the report was ready."
+    assert _join_overlapping(previous, current, 1.0) == f"{previous} {current}"
+
+
+def test_join_keeps_punctuation_after_the_repeat():
+    joined = _join_overlapping(
+        "Hello there my friend", "there my friend, how are you?", 1.0
+    )
+    assert joined == "Hello there my friend, how are you?"
+
+
+class _FakeTranscriptions:
+    """Transcribes each second of audio as the words its sample value names."""
+
+    def create(self, model, file, response_format):
+        with wave.open(io.BytesIO(file[1])) as chunk:
+            samples = np.frombuffer(chunk.readframes(chunk.getnframes()), np.int16)
+        values = dict.fromkeys(int(s) // 100 for s in samples if s)
+        return " ".join(f"phrase{v:02d} words{v:02d}" for v in values)
+
+
+def test_chunks_either_side_of_a_skipped_silent_chunk_are_not_deduplicated(tmp_path):
+    # Speech in 0-10 s and 20-25 s, and the first words after the silence
+    # repeat the last ones before it
+    rate = 100
+    per_second = [*range(1, 11), *[0] * 10, *range(10, 15)]
+    samples = np.repeat(np.array(per_second, dtype=np.int16) * 100, rate)
+    path = tmp_path / "speech.wav"
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(samples.tobytes())
+
+    transcriber = OpenAITranscriber(STTConfig(
+        api_key="test", max_chunk_seconds=6, chunk_overlap_sec=1.0
+    ))
+    transcriber._client = SimpleNamespace(
+        audio=SimpleNamespace(transcriptions=_FakeTranscriptions())
+    )
+    text = transcriber.transcribe(path)
+
+    # The uploaded chunks cover 0-6, 5-11, 16-22 and 21-25 s, the silent
+    # 10-16 s chunk being skipped, so the repeated phrase10 is kept
+    spoken = [*range(1, 11), *range(10, 15)]
+    assert text == " ".join(f"phrase{v:02d} words{v:02d}" for v in spoken)
@@ -1,15 +1,47 @@
 """Audio recording functionality using sounddevice."""
 
-import threading
-import wave
+import gc
+import os
+import struct
+import time
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
 import numpy as np
 import platformdirs
-import sounddevice as sd
+
+if TYPE_CHECKING:
+    import sounddevice as sd
+
+# sounddevice loads PortAudio and probes host APIs on import, so it is
+# imported on first use rather than when the GUI starts
+_sd = None
+
+
+def _get_sd():
+    """Import sounddevice on first use and return the module."""
+    global _sd
+    if _sd is None:
+        import sounddevice
+        _sd = sounddevice
+    return _sd
+
+
+# Frames delivered per audio callback
+BLOCK_SIZE = 1024
+
+# Bytes of audio to accumulate before writing to disk (~2 s of 16 kHz mono)
+FLUSH_THRESHOLD = 65536
+
+# Seconds a device enumeration is reused before PortAudio is queried again
+DEVICE_CACHE_TTL = 2.0
+
+# Bytes per 16-bit PCM sample
+SAMPLE_WIDTH = 2
+
+# Flags for the output file; O_BINARY only exists (and matters) on Windows
+_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
 
 
 class RecorderError(Exception):
@@ -36,6 +68,12 @@ class AudioRecorder:
     Audio is written incrementally to avoid memory issues with long recordings.
     """
 
+    # (monotonic timestamp, input devices) from the last enumeration
+    _device_cache: Optional[tuple[float, list[AudioDevice]]] = None
+
+    # Canonical 44-byte little-endian RIFF/WAVE header for 16-bit PCM
+    _HEADER_STRUCT = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
     def __init__(
         self,
         sample_rate: int = 16000,
@@ -46,20 +84,42 @@ class AudioRecorder:
         self.channels = channels
         self.temp_dir = temp_dir or Path(platformdirs.user_cache_dir("VoiceDeck"))
 
-        self._stream: Optional[sd.InputStream] = None
-        self._wav_file: Optional[wave.Wave_write] = None
+        self._stream: Optional["sd.InputStream"] = None
+        self._fd: Optional[int] = None  # Raw descriptor of the WAV file
+        self._data_bytes = 0
+        self._header_bytes = bytearray(self._HEADER_STRUCT.size)
         self._current_file: Optional[Path] = None
         self._is_recording = False
-        self._lock = threading.Lock()
         self._error_callback: Optional[Callable[[str], None]] = None
         self._current_level: float = 0.0  # RMS level for meter display
-
-    @staticmethod
-    def list_devices() -> list[AudioDevice]:
+        self._level_callback: Optional[Callable[[float], None]] = None
+
+        # Scratch buffer for the level meter's float samples, allocated in
+        # start() so the audio callback never allocates
+        self._f32_buf: Optional[np.ndarray] = None
+
+        # Converted int16 frames waiting to be written, so the file sees one
+        # write per FLUSH_THRESHOLD bytes instead of one per callback. The
+        # callback converts straight into this buffer, which is allocated
+        # once in start() and filled up to _write_pos frames.
+        self._write_buf: Optional[np.ndarray] = None
+        self._write_pos = 0
+        self._flush_threshold = FLUSH_THRESHOLD
+        self._flush_frames = 0
+
+        # Whether the cyclic GC was enabled before recording paused it
+        self._gc_was_enabled = False
+
+    @classmethod
+    def list_devices(cls) -> list[AudioDevice]:
         """List all available audio input devices."""
+        cached = cls._device_cache
+        if cached is not None and time.monotonic() - cached[0] < DEVICE_CACHE_TTL:
+            return list(cached[1])
+
         devices = []
         try:
-            device_list = sd.query_devices()
+            device_list = _get_sd().query_devices()
             for i, dev in enumerate(device_list):
                 # Only include input devices (max_input_channels > 0)
                 if dev.get("max_input_channels", 0) > 0:
@@ -74,64 +134,122 @@ class AudioRecorder:
         except Exception as e:
             raise RecorderError(f"Failed to list audio devices: {e}") from e
 
-        return devices
+        cls._device_cache = (time.monotonic(), devices)
+        return list(devices)
 
-    @staticmethod
-    def get_default_device() -> Optional[AudioDevice]:
+    @classmethod
+    def invalidate_device_cache(cls) -> None:
+        """Force the next device lookup to re-enumerate PortAudio devices."""
+        cls._device_cache = None
+
+    @classmethod
+    def get_default_device(cls) -> Optional[AudioDevice]:
         """Get the default input device."""
+        devices = cls.list_devices()
+
         try:
-            default_idx = sd.default.device[0]  # Input device index
-            if default_idx is None or default_idx < 0:
-                devices = AudioRecorder.list_devices()
-                return devices[0] if devices else None
-
-            dev = sd.query_devices(default_idx)
-            if dev.get("max_input_channels", 0) > 0:
-                return AudioDevice(
-                    index=default_idx,
-                    name=dev["name"],
-                    channels=dev["max_input_channels"],
-                    default_sample_rate=dev["default_samplerate"],
-                )
+            default_idx = _get_sd().default.device[0]  # Input device index
         except Exception:
-            pass
+            default_idx = None
+
+        # Look up the default in the (cached) input device list; this also
+        # rules out a default that is not an input device
+        if default_idx is not None and default_idx >= 0:
+            for device in devices:
+                if device.index == default_idx:
+                    return device
 
         # Fallback: return first available input device
-        devices = AudioRecorder.list_devices()
         return devices[0] if devices else None
 
     def set_error_callback(self, callback: Callable[[str], None]) -> None:
         """Set callback to be called when an error occurs during recording."""
         self._error_callback = callback
 
+    def set_level_callback(self, callback: Optional[Callable[[float], None]]) -> None:
+        """
+        Set callback to receive the input level (0.0 to 1.0) for each audio block.
+
+        The callback runs on the audio thread, so it must be quick and must
+        not touch GUI objects directly.
+        """
+        self._level_callback = callback
+
     def _generate_filename(self) -> Path:
         """Generate a unique filename for the recording."""
         self.temp_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return self.temp_dir / f"recording_{timestamp}.wav"
+        # Nanosecond timestamps also keep back-to-back recordings from
+        # colliding, which second-resolution names could
+        return self.temp_dir / f"recording_{time.time_ns()}.wav"
 
     def _audio_callback(
         self,
         indata: np.ndarray,
         frames: int,
         time_info: dict,
-        status: sd.CallbackFlags,
+        status: "sd.CallbackFlags",
     ) -> None:
         """Callback function called for each audio block."""
         if status and self._error_callback:
             self._error_callback(f"Audio status: {status}")
 
-        # Calculate RMS level for meter display
-        rms = np.sqrt(np.mean(indata ** 2))
+        # Calculate RMS level for meter display on samples scaled to -1..1
+        scaled = self._f32_buf[:frames].reshape(-1)
+        np.multiply(indata.reshape(-1), 1.0 / 32768.0, out=scaled)
+        rms = np.sqrt(np.dot(scaled, scaled) / scaled.size)
         # Convert to 0-1 range with some headroom (typical speech is -20 to -6 dB)
         # Using a gentle curve for better visual response
         self._current_level = min(1.0, rms * 4.0)
+        if self._level_callback and self._is_recording:
+            self._level_callback(self._current_level)
+
+        # No lock here: stop() clears _is_recording and then stops the stream,
+        # which waits for in-flight callbacks, before it touches the file
+        if self._fd is not None and self._is_recording:
+            # PortAudio delivers 16-bit samples, so the block is copied into
+            # the write buffer as-is
+            end = self._write_pos + frames
+            np.copyto(self._write_buf[self._write_pos:end], indata)
+            self._write_pos = end
+            if end >= self._flush_frames:
+                self._flush_write_buf()
+
+    def _flush_write_buf(self) -> None:
+        """Write buffered audio to the WAV file."""
+        if self._write_pos:
+            self._data_bytes += self._write_all(self._write_buf[:self._write_pos])
+            self._write_pos = 0
+
+    def _write_all(self, data) -> int:
+        """
+        Write a contiguous buffer to the WAV file descriptor.
 
-        with self._lock:
-            if self._wav_file is not None and self._is_recording:
-                # Convert float32 to int16 for WAV file
-                audio_data = (indata * 32767).astype(np.int16)
-                self._wav_file.writeframes(audio_data.tobytes())
+        Goes straight to os.write() rather than a buffered file object:
+        flushes are already large, so the extra buffering layer only adds
+        a copy. Returns the number of bytes written.
+        """
+        view = memoryview(data).cast("B")
+        total = len(view)
+        while view:
+            view = view[os.write(self._fd, view):]
+        return total
+
+    def _pack_header(self, data_bytes: int) -> bytearray:
+        """Fill the reusable header buffer for the given data chunk size."""
+        self._HEADER_STRUCT.pack_into(
+            self._header_bytes, 0,
+            b"RIFF", 36 + data_bytes, b"WAVE",
+            b"fmt ", 16, 1, self.channels, self.sample_rate,
+            self.sample_rate * self.channels * SAMPLE_WIDTH,
+            self.channels * SAMPLE_WIDTH, SAMPLE_WIDTH * 8,
+            b"data", data_bytes,
+        )
+        return self._header_bytes
+
+    def _finalize_header(self) -> None:
+        """Rewrite the header with the RIFF and data chunk sizes now known."""
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        self._write_all(self._pack_header(self._data_bytes))
 
     def start(self, device: Optional[AudioDevice] = None) -> Path:
         """
@@ -149,39 +267,54 @@ class AudioRecorder:
         if self._is_recording:
             raise RecorderError("Already recording")
 
+        try:
+            sd = _get_sd()
+        except OSError as e:
+            raise RecorderError(f"Audio backend unavailable: {e}") from e
+
         if device is None:
             device = self.get_default_device()
             if device is None:
                 raise RecorderError("No audio input devices available")
 
-        # Verify device is still valid
-        try:
-            sd.query_devices(device.index)
-        except Exception as e:
-            raise RecorderError(f"Selected device is not available: {e}") from e
-
         self._current_file = self._generate_filename()
 
+        if self._f32_buf is None or self._f32_buf.shape != (BLOCK_SIZE, self.channels):
+            self._f32_buf = np.empty((BLOCK_SIZE, self.channels), dtype=np.float32)
+            # Room for a full threshold plus the block that crosses it
+            self._flush_frames = max(
+                1, self._flush_threshold // (self.channels * SAMPLE_WIDTH)
+            )
+            self._write_buf = np.empty(
+                (self._flush_frames + BLOCK_SIZE, self.channels), dtype=np.int16
+            )
+        self._write_pos = 0
+
         try:
-            # Open WAV file for writing
-            self._wav_file = wave.open(str(self._current_file), "wb")
-            self._wav_file.setnchannels(self.channels)
-            self._wav_file.setsampwidth(2)  # 16-bit audio
-            self._wav_file.setframerate(self.sample_rate)
+            # Open WAV file for writing; the sizes in the header are
+            # placeholders until stop() patches them
+            self._fd = os.open(self._current_file, _OPEN_FLAGS, 0o644)
+            self._write_all(self._pack_header(0))
+            self._data_bytes = 0
 
             # Create and start the input stream
             self._stream = sd.InputStream(
                 device=device.index,
                 channels=self.channels,
                 samplerate=self.sample_rate,
-                dtype=np.float32,
+                dtype=np.int16,
                 callback=self._audio_callback,
-                blocksize=1024,
+                blocksize=BLOCK_SIZE,
             )
 
             self._is_recording = True
             self._stream.start()
 
+            # Keep collector pauses off the audio thread while recording;
+            # stop() re-enables it and collects what piled up
+            self._gc_was_enabled = gc.isenabled()
+            gc.disable()
+
         except sd.PortAudioError as e:
             self._cleanup()
             if "Invalid device" in str(e):
@@ -208,54 +341,64 @@ class AudioRecorder:
         if not self._is_recording:
             return None
 
-        with self._lock:
-            self._is_recording = False
-
-        # Stop and close stream
-        if self._stream is not None:
-            try:
-                self._stream.stop()
-                self._stream.close()
-            except Exception:
-                pass
-            self._stream = None
-
-        # Close WAV file
-        if self._wav_file is not None:
-            try:
-                self._wav_file.close()
-            except Exception:
-                pass
-            self._wav_file = None
-
         result = self._current_file
-        self._current_file = None
+        self._shutdown(delete=False)
         return result
 
     def _cleanup(self) -> None:
         """Clean up resources on error."""
+        self._shutdown(delete=True)
+
+    def _shutdown(self, *, delete: bool) -> None:
+        """
+        Stop the stream and close the output file.
+
+        Args:
+            delete: Discard the partial recording instead of finalizing it.
+        """
         self._is_recording = False
 
+        # Stop and close stream; stop() returns only once no callback is
+        # running, so the file can be finalized safely afterwards. When
+        # discarding, close() alone aborts the stream.
         if self._stream is not None:
             try:
+                if not delete:
+                    self._stream.stop()
                 self._stream.close()
             except Exception:
                 pass
             self._stream = None
 
-        if self._wav_file is not None:
+        # Flush remaining audio, finalize header and close WAV file
+        if self._fd is not None:
             try:
-                self._wav_file.close()
+                if not delete:
+                    self._flush_write_buf()
+                    self._finalize_header()
             except Exception:
                 pass
-            self._wav_file = None
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+        self._write_pos = 0
+        self._restore_gc()
 
-        if self._current_file is not None and self._current_file.exists():
+        if delete and self._current_file is not None:
             try:
-                self._current_file.unlink()
-            except Exception:
+                self._current_file.unlink(missing_ok=True)
+            except OSError:
                 pass
-            self._current_file = None
+        self._current_file = None
+
+    def _restore_gc(self) -> None:
+        """Re-enable garbage collection if recording disabled it."""
+        if self._gc_was_enabled:
+            self._gc_was_enabled = False
+            gc.enable()
+            gc.collect()
 
     @property
     def is_recording(self) -> bool:
@@ -9,6 +9,32 @@ from typing import Optional
 import platformdirs
 import toml
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
+# Last parse of each config file with the mtime_ns it was read at, so
+# repeated loads of an unchanged file skip the TOML parse
+_parse_cache: dict[str, tuple[int, dict]] = {}
+
+
+def _read_toml(path: Path) -> dict:
+    """
+    Parse a TOML file, reusing the previous result if it is unchanged.
+
+    The returned dict is shared between calls and must not be modified.
+    """
+    key = str(path)
+    mtime_ns = path.stat().st_mtime_ns
+    cached = _parse_cache.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    with open(path, "rb") as f:
+        data = tomllib.load(f)
+    _parse_cache[key] = (mtime_ns, data)
+    return data
+
 
 @dataclass
 class STTConfig:
@@ -19,6 +45,9 @@ class STTConfig:
     api_key: Optional[str] = None
     max_chunk_seconds: int = 600  # 10 minutes per chunk
     max_chunk_mb: int = 24  # OpenAI limit is 25MB, use 24 for safety
+    parallel_chunks: int = 4  # Chunk uploads in flight at once
+    chunk_overlap_sec: float = 1.0  # Audio shared by consecutive chunks
+    silence_threshold: float = 0.005  # Chunks quieter than this are skipped
 
 
 @dataclass
@@ -84,7 +113,7 @@ class AppConfig:
         for config_path in cls.get_config_paths():
             if config_path.exists():
                 try:
-                    data = toml.load(config_path)
+                    data = _read_toml(config_path)
                     config = cls._from_dict(data)
                     break
                 except Exception:
@@ -123,6 +152,15 @@ class AppConfig:
             config.stt.max_chunk_mb = stt_data.get(
                 "max_chunk_mb", config.stt.max_chunk_mb
             )
+            config.stt.parallel_chunks = stt_data.get(
+                "parallel_chunks", config.stt.parallel_chunks
+            )
+            config.stt.chunk_overlap_sec = stt_data.get(
+                "chunk_overlap_sec", config.stt.chunk_overlap_sec
+            )
+            config.stt.silence_threshold = stt_data.get(
+                "silence_threshold", config.stt.silence_threshold
+            )
 
         if "audio" in data:
             audio_data = data["audio"]
@@ -156,6 +194,9 @@ class AppConfig:
                 "model": self.stt.model,
                 "max_chunk_seconds": self.stt.max_chunk_seconds,
                 "max_chunk_mb": self.stt.max_chunk_mb,
+                "parallel_chunks": self.stt.parallel_chunks,
+                "chunk_overlap_sec": self.stt.chunk_overlap_sec,
+                "silence_threshold": self.stt.silence_threshold,
             },
             "audio": {
                 "sample_rate": self.audio.sample_rate,
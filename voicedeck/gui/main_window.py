@@ -1,10 +1,13 @@
 """Main application window for VoiceDeck."""
 
+import copy
+import queue
+import threading
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import Qt, QThread, Signal, Slot, QTimer
-from PySide6.QtGui import QShortcut, QKeySequence
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal, Slot, QTimer
+from PySide6.QtGui import QShortcut, QKeySequence, QTextCursor
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -24,55 +27,139 @@ from ..stt import Transcriber, TranscriberError
 from ..stt.openai_client import create_transcriber
 from ..config import AppConfig
 from ..keyring_storage import get_api_key
-from .styles import DARK_STYLESHEET
+from .styles import STATUS_LABEL_STYLES
 from .settings_dialog import SettingsDialog
-from .widgets import RecordButton, LevelMeter, LEDIndicator
+from .widgets import RecordButton, LevelMeter, LEDIndicator, batch_led_updates
 
+# Smallest level change worth repainting the meter for
+LEVEL_EPSILON = 0.005
 
-class TranscriptionWorker(QThread):
-    """Background worker for audio transcription."""
+# Transcripts longer than this are inserted in pieces across event-loop
+# iterations so the window stays responsive while the text is laid out
+TRANSCRIPT_CHUNK_CHARS = 50_000
+
+# Status LED colour names accepted by MainWindow._set_status
+_LED_COLORS = {
+    "red": LEDIndicator.COLOR_RED,
+    "green": LEDIndicator.COLOR_GREEN,
+    "yellow": LEDIndicator.COLOR_YELLOW,
+    "blue": LEDIndicator.COLOR_BLUE,
+}
+
+
+class TranscriptionSignals(QObject):
+    """Signals emitted by a TranscriptionTask."""
 
     finished = Signal(str)
     error = Signal(str)
 
+
+class TranscriptionTask:
+    """Background task for audio transcription, run on the transcription thread."""
+
     def __init__(self, transcriber: Transcriber, audio_path: Path):
-        super().__init__()
         self.transcriber = transcriber
         self.audio_path = audio_path
+        self.signals = TranscriptionSignals()
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Stop before the next request and drop the result of one in flight."""
+        self._cancelled.set()
+        self.signals.blockSignals(True)
 
     def run(self):
         try:
-            transcript = self.transcriber.transcribe(self.audio_path)
-            self.finished.emit(transcript)
+            transcript = self.transcriber.transcribe(self.audio_path, self._cancelled)
+            self.signals.finished.emit(transcript)
         except TranscriberError as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
         except Exception as e:
-            self.error.emit(f"Unexpected error: {e}")
+            self.signals.error.emit(f"Unexpected error: {e}")
+
+
+def _run_transcriptions(tasks: "queue.SimpleQueue[TranscriptionTask]"):
+    """Run queued transcription tasks one after another, forever."""
+    while True:
+        tasks.get().run()
+
+
+class DeviceListSignals(QObject):
+    """Signals emitted by a DeviceListTask."""
+
+    finished = Signal(list, object)  # devices, default device
+    error = Signal(str)
+
+
+class DeviceListTask(QRunnable):
+    """Background task that enumerates audio input devices."""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = DeviceListSignals()
+
+    def run(self):
+        try:
+            AudioRecorder.invalidate_device_cache()
+            devices = AudioRecorder.list_devices()
+            default_device = AudioRecorder.get_default_device()
+            self.signals.finished.emit(devices, default_device)
+        except RecorderError as e:
+            self.signals.error.emit(str(e))
 
 
 class MainWindow(QMainWindow):
     """Main application window."""
 
+    # Input level from the audio thread, delivered to the GUI thread
+    levelReceived = Signal(float)
+
     def __init__(self, config: AppConfig, transcriber: Transcriber):
         super().__init__()
 
         self.config = config
         self.transcriber = transcriber
-        self.recorder = AudioRecorder(
-            sample_rate=config.audio.sample_rate,
-            channels=config.audio.channels,
-            temp_dir=config.get_temp_dir(),
-        )
+        self.recorder = self._create_recorder()
 
         self._current_audio_path: Optional[Path] = None
-        self._transcription_worker: Optional[TranscriptionWorker] = None
-        self._devices: list[AudioDevice] = []
-        self._shortcuts: list[QShortcut] = []
+        self._transcription_task: Optional[TranscriptionTask] = None
+        self._device_task: Optional[DeviceListTask] = None
+        self._settings_dialog: Optional[SettingsDialog] = None
 
-        # Level meter update timer
-        self._level_timer = QTimer(self)
-        self._level_timer.timeout.connect(self._update_level_meter)
-        self._level_timer.setInterval(50)  # 20 FPS
+        # Keyring lookups can be slow, so read the key once and refresh it
+        # only when settings are saved
+        self._cached_api_key: Optional[str] = get_api_key()
+        self._devices: list[AudioDevice] = []
+        self._shortcuts: dict[str, QShortcut] = {}
+        self._status_key = "ready"
+        self._last_ui_state: tuple = ()
+        self._has_transcript = False
+        self._last_level = 0.0
+        self._pending_transcript: list[str] = []
+
+        # Single reusable worker thread for transcriptions, instead of
+        # spawning a new thread per recording. It is a daemon thread rather
+        # than a QThreadPool, which waits for its tasks when destroyed, so an
+        # upload still in flight when the window closes doesn't hold up exit.
+        self._transcription_queue: "queue.SimpleQueue[TranscriptionTask]" = (
+            queue.SimpleQueue()
+        )
+        threading.Thread(
+            target=_run_transcriptions,
+            args=(self._transcription_queue,),
+            name="transcription",
+            daemon=True,
+        ).start()
+
+        # The recorder pushes a level per audio block; emitting from the
+        # audio thread queues the update onto the GUI thread
+        self.levelReceived.connect(self._update_level_meter)
+
+        # Feeds the remaining pieces of a long transcript into the editor
+        self._transcript_timer = QTimer(self)
+        self._transcript_timer.setSingleShot(True)
+        self._transcript_timer.setInterval(0)
+        self._transcript_timer.timeout.connect(self._append_transcript_chunk)
 
         self._setup_ui()
         self._setup_shortcuts()
@@ -85,7 +172,6 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("VoiceDeck")
         self.setMinimumSize(600, 650)
         self.resize(700, 725)
-        self.setStyleSheet(DARK_STYLESHEET)
 
         # Central widget and layout
         central = QWidget()
@@ -101,12 +187,7 @@ class MainWindow(QMainWindow):
 
         # App title
         title_label = QLabel("VoiceDeck")
-        title_label.setStyleSheet("""
-            font-size: 18px;
-            font-weight: 600;
-            color: #c0c0c8;
-            letter-spacing: 1px;
-        """)
+        title_label.setObjectName("titleLabel")
         top_bar.addWidget(title_label)
         top_bar.addStretch()
 
@@ -119,8 +200,8 @@ class MainWindow(QMainWindow):
 
         # Separator line
         separator = QFrame()
+        separator.setObjectName("separator")
         separator.setFrameShape(QFrame.Shape.HLine)
-        separator.setStyleSheet("background-color: #2a2a32; max-height: 1px;")
         layout.addWidget(separator)
 
         # Microphone section
@@ -178,6 +259,9 @@ class MainWindow(QMainWindow):
             "Your transcribed text will appear here..."
         )
         self.transcript_edit.setMinimumHeight(160)
+        # Read-only, so there is nothing to undo; skip recording each insert
+        self.transcript_edit.document().setUndoRedoEnabled(False)
+        self.transcript_edit.textChanged.connect(self._on_transcript_changed)
         layout.addWidget(self.transcript_edit, 1)
 
         # Button row
@@ -200,31 +284,40 @@ class MainWindow(QMainWindow):
         layout.addLayout(btn_layout)
 
     def _setup_shortcuts(self):
-        """Set up keyboard shortcuts from config."""
-        # Clear existing shortcuts
-        for shortcut in self._shortcuts:
-            shortcut.setEnabled(False)
-            shortcut.deleteLater()
-        self._shortcuts.clear()
-
-        # Toggle recording shortcut
-        toggle_shortcut = QShortcut(
-            QKeySequence(self.config.shortcuts.toggle_recording), self
-        )
-        toggle_shortcut.activated.connect(self._toggle_recording)
-        self._shortcuts.append(toggle_shortcut)
-
-        # Copy transcript shortcut
-        copy_shortcut = QShortcut(
-            QKeySequence(self.config.shortcuts.copy_transcript), self
+        """Set up keyboard shortcuts from config, updating existing ones in place."""
+        bindings = {
+            "toggle_recording": (
+                self.config.shortcuts.toggle_recording, self._toggle_recording
+            ),
+            "copy_transcript": (
+                self.config.shortcuts.copy_transcript, self._copy_transcript
+            ),
+        }
+
+        for name, (keys, slot) in bindings.items():
+            sequence = QKeySequence(keys)
+            shortcut = self._shortcuts.get(name)
+            if shortcut is None:
+                shortcut = QShortcut(sequence, self)
+                shortcut.activated.connect(slot)
+                self._shortcuts[name] = shortcut
+            elif shortcut.key() != sequence:
+                shortcut.setKey(sequence)
+
+    def _create_recorder(self) -> AudioRecorder:
+        """Create a recorder for the current audio settings."""
+        recorder = AudioRecorder(
+            sample_rate=self.config.audio.sample_rate,
+            channels=self.config.audio.channels,
+            temp_dir=self.config.get_temp_dir(),
         )
-        copy_shortcut.activated.connect(self._copy_transcript)
-        self._shortcuts.append(copy_shortcut)
+        recorder.set_level_callback(self.levelReceived.emit)
+        return recorder
 
     def _check_api_key_on_start(self):
         """Check if API key is configured on startup."""
         # Check keyring first, then config, then env
-        api_key = get_api_key() or self.config.stt.api_key
+        api_key = self._cached_api_key or self.config.stt.api_key
         if not api_key:
             # Show a friendly prompt to configure
             QMessageBox.information(
@@ -236,70 +329,96 @@ class MainWindow(QMainWindow):
 
     def _open_settings(self):
         """Open the settings dialog."""
-        dialog = SettingsDialog(self.config, self)
-        dialog.settings_changed.connect(self._on_settings_changed)
-        dialog.exec()
+        # Build the dialog once and refill it on later opens. It edits a
+        # copy so the live config stays intact until the new one is applied.
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(copy.deepcopy(self.config), self)
+            self._settings_dialog.settings_changed.connect(self._on_settings_changed)
+        else:
+            self._settings_dialog.refresh_from_config(copy.deepcopy(self.config))
+        self._settings_dialog.open()
 
-    @Slot()
-    def _on_settings_changed(self):
+    @Slot(str)
+    def _on_settings_changed(self, api_key: str):
         """Handle settings changes."""
         # Reload config
-        self.config = AppConfig.load()
+        config = AppConfig.load()
 
-        # Update API key from keyring
-        api_key = get_api_key()
+        # Use the API key the dialog just saved
+        self._cached_api_key = api_key or None
         if api_key:
-            self.config.stt.api_key = api_key
+            config.stt.api_key = api_key
 
-        # Recreate transcriber with new settings
-        try:
-            self.transcriber = create_transcriber(self.config.stt)
-        except Exception as e:
-            QMessageBox.warning(
-                self,
-                "Configuration Error",
-                f"Failed to apply settings: {e}",
-            )
-            return
+        # Recreate transcriber only if its settings changed. If that fails,
+        # keep the transcriber and the settings it was built from, so saving
+        # again retries; the rest of the settings still apply.
+        error = None
+        if config.stt != self.config.stt:
+            try:
+                self.transcriber = create_transcriber(config.stt)
+            except Exception as e:
+                error = e
+                config.stt = self.config.stt
 
-        # Recreate recorder with new audio settings
-        self.recorder = AudioRecorder(
-            sample_rate=self.config.audio.sample_rate,
-            channels=self.config.audio.channels,
-            temp_dir=self.config.get_temp_dir(),
-        )
+        old_audio = self.config.audio
+        self.config = config
+
+        # Recreate recorder only if its audio settings changed
+        if self.config.audio != old_audio:
+            self.recorder = self._create_recorder()
 
         # Update shortcuts
         self._setup_shortcuts()
 
-        self._set_status("Settings saved", "green")
+        if error is not None:
+            QMessageBox.warning(
+                self,
+                "Configuration Error",
+                f"Failed to apply settings: {error}",
+            )
+        else:
+            self._set_status("Settings saved", "green")
 
     def _refresh_devices(self):
-        """Refresh the list of available audio devices."""
-        self.mic_combo.clear()
-        self._devices = []
+        """Refresh the list of available audio devices in the background."""
+        if self._device_task is not None:
+            return
 
-        try:
-            self._devices = AudioRecorder.list_devices()
-        except RecorderError as e:
-            self._set_status(f"Error: {e}", "red")
+        if not self._devices:
+            self.mic_combo.clear()
+            self.mic_combo.addItem("Loading microphones...")
+            self.mic_combo.setEnabled(False)
+
+        # PortAudio enumeration can take a noticeable time, so keep it off
+        # the UI thread
+        task = DeviceListTask()
+        task.signals.finished.connect(self._on_devices_listed)
+        task.signals.error.connect(self._on_devices_error)
+        self._device_task = task
+        QThreadPool.globalInstance().start(task)
+
+    @Slot(list, object)
+    def _on_devices_listed(self, devices: list, default_device: Optional[AudioDevice]):
+        """Populate the device combo box from a finished enumeration."""
+        self._device_task = None
+
+        # Keep the current selection if nothing changed
+        if devices and devices == self._devices:
             return
+        self._devices = devices
 
+        self.mic_combo.clear()
         if not self._devices:
             self.mic_combo.addItem("No microphones found")
-            self.mic_combo.setEnabled(False)
-            self.record_btn.setEnabled(False)
             self.mic_led.set_color(LEDIndicator.COLOR_RED)
             self.mic_led.set_on(True)
+            self._update_ui_state()
             return
 
-        self.mic_combo.setEnabled(True)
-        self.record_btn.setEnabled(True)
         self.mic_led.set_color(LEDIndicator.COLOR_GREEN)
         self.mic_led.set_on(True)
 
         # Add devices to combo box
-        default_device = AudioRecorder.get_default_device()
         default_index = 0
 
         for i, device in enumerate(self._devices):
@@ -308,6 +427,16 @@ class MainWindow(QMainWindow):
                 default_index = i
 
         self.mic_combo.setCurrentIndex(default_index)
+        self._update_ui_state()
+
+    @Slot(str)
+    def _on_devices_error(self, error_msg: str):
+        """Handle a failed device enumeration."""
+        self._device_task = None
+        self._devices = []
+        self.mic_combo.clear()
+        self._set_status(f"Error: {error_msg}", "red")
+        self._update_ui_state()
 
     def _get_selected_device(self) -> Optional[AudioDevice]:
         """Get the currently selected audio device."""
@@ -317,41 +446,45 @@ class MainWindow(QMainWindow):
         self, text: str, led_color: str = None, recording: bool = False, transcribing: bool = False
     ):
         """Update the status label and LED."""
-        self.status_label.setText(text)
-        self.status_label.setProperty("recording", recording)
-        self.status_label.setProperty("transcribing", transcribing)
-        self.status_label.style().unpolish(self.status_label)
-        self.status_label.style().polish(self.status_label)
-
-        # Update status LED
-        if led_color == "red":
-            self.status_led.set_color(LEDIndicator.COLOR_RED)
-            self.status_led.set_on(True)
-        elif led_color == "green":
-            self.status_led.set_color(LEDIndicator.COLOR_GREEN)
-            self.status_led.set_on(True)
-        elif led_color == "yellow":
-            self.status_led.set_color(LEDIndicator.COLOR_YELLOW)
-            self.status_led.set_on(True)
-        elif led_color == "blue":
-            self.status_led.set_color(LEDIndicator.COLOR_BLUE)
-            self.status_led.set_on(True)
-        elif recording:
-            self.status_led.set_color(LEDIndicator.COLOR_RED)
-            self.status_led.set_on(True)
-        elif transcribing:
-            self.status_led.set_color(LEDIndicator.COLOR_BLUE)
-            self.status_led.set_on(True)
-        else:
-            self.status_led.set_on(False)
+        with batch_led_updates():
+            self.status_label.setText(text)
+
+            # Restyle the label only when its state actually changes
+            if recording:
+                status_key = "recording"
+            elif transcribing:
+                status_key = "transcribing"
+            else:
+                status_key = "ready"
+            if status_key != self._status_key:
+                self._status_key = status_key
+                self.status_label.setStyleSheet(STATUS_LABEL_STYLES[status_key])
+
+            # Update status LED
+            color = _LED_COLORS.get(led_color)
+            if color is None:
+                if recording:
+                    color = LEDIndicator.COLOR_RED
+                elif transcribing:
+                    color = LEDIndicator.COLOR_BLUE
+            if color is not None:
+                self.status_led.set_color(color)
+                self.status_led.set_on(True)
+            else:
+                self.status_led.set_on(False)
 
     def _update_ui_state(self):
         """Update UI element states based on current recording state."""
         is_recording = self.recorder.is_recording
-        is_transcribing = (
-            self._transcription_worker is not None
-            and self._transcription_worker.isRunning()
-        )
+        is_transcribing = self._transcription_task is not None
+        has_transcript = self._has_transcript
+        has_devices = bool(self._devices)
+
+        # Nothing to do if none of the inputs changed since the last update
+        state = (is_recording, is_transcribing, has_transcript, has_devices)
+        if state == self._last_ui_state:
+            return
+        self._last_ui_state = state
 
         # Update record button state (it handles its own appearance)
         self.record_btn.set_recording(is_recording)
@@ -361,13 +494,12 @@ class MainWindow(QMainWindow):
         elif is_transcribing:
             self.record_btn.setEnabled(False)
         else:
-            self.record_btn.setEnabled(bool(self._devices))
+            self.record_btn.setEnabled(has_devices)
 
         # Disable mic selection during recording or transcription
-        self.mic_combo.setEnabled(not is_recording and not is_transcribing and bool(self._devices))
+        self.mic_combo.setEnabled(not is_recording and not is_transcribing and has_devices)
 
         # Enable copy/clear only when there's transcript text
-        has_transcript = bool(self.transcript_edit.toPlainText().strip())
         self.copy_btn.setEnabled(has_transcript)
         self.clear_btn.setEnabled(has_transcript or is_recording or is_transcribing)
 
@@ -402,7 +534,7 @@ class MainWindow(QMainWindow):
             return False
 
         # Check if transcriber is configured (check keyring too)
-        api_key = get_api_key() or self.config.stt.api_key
+        api_key = self._cached_api_key or self.config.stt.api_key
         if not api_key:
             QMessageBox.warning(
                 self,
@@ -425,7 +557,7 @@ class MainWindow(QMainWindow):
             self._current_audio_path = self.recorder.start(device)
             self._set_status("Recording...", recording=True)
             self.record_btn.set_recording(True)
-            self._level_timer.start()
+            self._last_level = 0.0
             self._update_ui_state()
             return True
         except RecorderError as e:
@@ -434,7 +566,6 @@ class MainWindow(QMainWindow):
 
     def _stop_recording(self):
         """Stop recording and start transcription."""
-        self._level_timer.stop()
         self.level_meter.reset()
 
         audio_path = self.recorder.stop()
@@ -450,25 +581,31 @@ class MainWindow(QMainWindow):
 
     def _start_transcription(self, audio_path: Path):
         """Start background transcription of the audio file."""
+        task = TranscriptionTask(self.transcriber, audio_path)
+        task.signals.finished.connect(self._on_transcription_complete)
+        task.signals.error.connect(self._on_transcription_error)
+        self._transcription_task = task
+
         self._set_status("Transcribing...", transcribing=True)
         self._update_ui_state()
 
-        self._transcription_worker = TranscriptionWorker(self.transcriber, audio_path)
-        self._transcription_worker.finished.connect(self._on_transcription_complete)
-        self._transcription_worker.error.connect(self._on_transcription_error)
-        self._transcription_worker.start()
+        self._transcription_queue.put(task)
 
-    @Slot()
-    def _update_level_meter(self):
-        """Update the level meter with current audio level."""
-        if self.recorder.is_recording:
-            level = self.recorder.get_current_level()
-            self.level_meter.set_level(level)
+    @Slot(float)
+    def _update_level_meter(self, level: float):
+        """Update the level meter with a level reported by the recorder."""
+        # Drop levels queued before recording stopped, and ones too close to
+        # the last to be visible
+        if not self.recorder.is_recording or abs(level - self._last_level) < LEVEL_EPSILON:
+            return
+        self._last_level = level
+        self.level_meter.set_level(level)
 
     @Slot(str)
     def _on_transcription_complete(self, transcript: str):
         """Handle successful transcription."""
-        self.transcript_edit.setPlainText(transcript)
+        self._transcription_task = None
+        self._set_transcript(transcript)
         self._set_status("Ready", "green")
         self._cleanup_audio()
         self._update_ui_state()
@@ -476,25 +613,58 @@ class MainWindow(QMainWindow):
     @Slot(str)
     def _on_transcription_error(self, error_msg: str):
         """Handle transcription error."""
+        self._transcription_task = None
         self._set_status(f"Error: {error_msg}", "red")
         self._update_ui_state()
 
     def _cleanup_audio(self):
         """Clean up temporary audio file if configured."""
-        if (
-            self.config.cleanup_audio_after_transcription
-            and self._current_audio_path
-            and self._current_audio_path.exists()
-        ):
+        if self.config.cleanup_audio_after_transcription and self._current_audio_path:
             try:
-                self._current_audio_path.unlink()
-            except Exception:
+                self._current_audio_path.unlink(missing_ok=True)
+            except OSError:
                 pass
         self._current_audio_path = None
 
+    def _set_transcript(self, text: str):
+        """Replace the transcript, inserting very long text in pieces."""
+        self._transcript_timer.stop()
+        self._pending_transcript = [
+            text[i:i + TRANSCRIPT_CHUNK_CHARS]
+            for i in range(TRANSCRIPT_CHUNK_CHARS, len(text), TRANSCRIPT_CHUNK_CHARS)
+        ]
+        self._pending_transcript.reverse()
+        self.transcript_edit.setPlainText(text[:TRANSCRIPT_CHUNK_CHARS])
+        if self._pending_transcript:
+            self._transcript_timer.start()
+
+    @Slot()
+    def _append_transcript_chunk(self):
+        """Append the next pending piece of the transcript."""
+        if not self._pending_transcript:
+            return
+        cursor = QTextCursor(self.transcript_edit.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(self._pending_transcript.pop())
+        if self._pending_transcript:
+            self._transcript_timer.start()
+
+    def _flush_transcript(self):
+        """Insert any transcript pieces that are still pending."""
+        self._transcript_timer.stop()
+        while self._pending_transcript:
+            self._append_transcript_chunk()
+
+    @Slot()
+    def _on_transcript_changed(self):
+        """Track whether the transcript has text without reading it back."""
+        # An empty document still holds one character (the block separator)
+        self._has_transcript = self.transcript_edit.document().characterCount() > 1
+
     @Slot()
     def _copy_transcript(self):
         """Copy transcript to clipboard."""
+        self._flush_transcript()
         text = self.transcript_edit.toPlainText()
         if text:
             clipboard = QApplication.clipboard()
@@ -506,11 +676,12 @@ class MainWindow(QMainWindow):
         """Clear the transcript and reset to ready state."""
         # Stop any ongoing recording
         if self.recorder.is_recording:
-            self._level_timer.stop()
             self.level_meter.reset()
             self.recorder.stop()
             self.record_btn.set_recording(False)
 
+        self._transcript_timer.stop()
+        self._pending_transcript = []
         self.transcript_edit.clear()
         self._current_audio_path = None
         self._set_status("Ready")
@@ -518,15 +689,14 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Handle window close event."""
-        # Stop level timer
-        self._level_timer.stop()
-
         # Stop recording if active
         if self.recorder.is_recording:
             self.recorder.stop()
 
-        # Wait for transcription to complete
-        if self._transcription_worker and self._transcription_worker.isRunning():
-            self._transcription_worker.wait(5000)  # Wait up to 5 seconds
+        # Cancel any transcription rather than waiting for it to finish. A
+        # request already in flight can't be interrupted; it is left to the
+        # daemon thread, which exit doesn't wait for, and its result dropped.
+        if self._transcription_task is not None:
+            self._transcription_task.cancel()
 
         event.accept()
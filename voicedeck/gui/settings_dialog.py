@@ -27,7 +27,7 @@ from ..keyring_storage import get_api_key, set_api_key, delete_api_key, is_keyri
 class SettingsDialog(QDialog):
     """Settings dialog with tabs for API, audio, and shortcuts."""
 
-    settings_changed = Signal()
+    settings_changed = Signal(str)  # API key that was saved, or ""
 
     def __init__(self, config: AppConfig, parent=None):
         super().__init__(parent)
@@ -101,10 +101,10 @@ class SettingsDialog(QDialog):
         # Keyring status
         if is_keyring_available():
             keyring_label = QLabel("API key will be stored securely in system keyring")
-            keyring_label.setStyleSheet("color: #4ecdc4; font-size: 12px;")
+            keyring_label.setObjectName("keyringOkLabel")
         else:
             keyring_label = QLabel("System keyring unavailable - key stored in config file")
-            keyring_label.setStyleSheet("color: #ffaa00; font-size: 12px;")
+            keyring_label.setObjectName("keyringWarnLabel")
         api_layout.addRow("", keyring_label)
 
         # Base URL (optional)
@@ -115,11 +115,13 @@ class SettingsDialog(QDialog):
         # Model selection
         self.model_combo = QComboBox()
         self.model_combo.setEditable(True)
-        self.model_combo.addItems([
+        models = [
             "whisper-1",
             "gpt-4o-transcribe",
             "gpt-4o-mini-transcribe",
-        ])
+        ]
+        self.model_combo.addItems(models)
+        self._model_index = {text: i for i, text in enumerate(models)}
         api_layout.addRow("Model:", self.model_combo)
 
         layout.addWidget(api_group)
@@ -155,7 +157,9 @@ class SettingsDialog(QDialog):
 
         # Sample rate
         self.sample_rate_combo = QComboBox()
-        self.sample_rate_combo.addItems(["16000", "22050", "44100", "48000"])
+        sample_rates = ["16000", "22050", "44100", "48000"]
+        self.sample_rate_combo.addItems(sample_rates)
+        self._sample_rate_index = {text: i for i, text in enumerate(sample_rates)}
         audio_layout.addRow("Sample Rate (Hz):", self.sample_rate_combo)
 
         # Channels
@@ -202,7 +206,7 @@ class SettingsDialog(QDialog):
         info_label = QLabel(
             "Note: Shortcuts only work when the application window is focused."
         )
-        info_label.setStyleSheet("color: #808080; font-size: 12px;")
+        info_label.setObjectName("infoLabel")
         info_label.setWordWrap(True)
         layout.addWidget(info_label)
 
@@ -224,6 +228,13 @@ class SettingsDialog(QDialog):
         self.record_shortcut_edit.setKeySequence(QKeySequence("Ctrl+Space"))
         self.copy_shortcut_edit.setKeySequence(QKeySequence("Ctrl+Shift+C"))
 
+    def refresh_from_config(self, config: AppConfig):
+        """Reload the form from a config before showing the dialog again."""
+        self.config = config
+        self.tabs.setCurrentIndex(0)
+        self.show_key_btn.setChecked(False)
+        self._load_settings()
+
     def _load_settings(self):
         """Load current settings into the UI."""
         # API settings
@@ -233,7 +244,7 @@ class SettingsDialog(QDialog):
 
         # Find and set model in combo
         model = self.config.stt.model
-        idx = self.model_combo.findText(model)
+        idx = self._model_index.get(model, -1)
         if idx >= 0:
             self.model_combo.setCurrentIndex(idx)
         else:
@@ -243,7 +254,7 @@ class SettingsDialog(QDialog):
         self.chunk_mb_spin.setValue(self.config.stt.max_chunk_mb)
 
         # Audio settings
-        sample_rate_idx = self.sample_rate_combo.findText(str(self.config.audio.sample_rate))
+        sample_rate_idx = self._sample_rate_index.get(str(self.config.audio.sample_rate), -1)
         if sample_rate_idx >= 0:
             self.sample_rate_combo.setCurrentIndex(sample_rate_idx)
 
@@ -302,5 +313,5 @@ class SettingsDialog(QDialog):
         # Write config to file
         save_config(self.config)
 
-        self.settings_changed.emit()
+        self.settings_changed.emit(api_key)
         self.accept()
@@ -2,6 +2,6 @@
 
 from .record_button import RecordButton
 from .level_meter import LevelMeter
-from .led_indicator import LEDIndicator
+from .led_indicator import LEDIndicator, LEDPreset, batch_led_updates
 
-__all__ = ["RecordButton", "LevelMeter", "LEDIndicator"]
+__all__ = ["RecordButton", "LevelMeter", "LEDIndicator", "LEDPreset", "batch_led_updates"]
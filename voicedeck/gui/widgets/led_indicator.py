@@ -1,112 +1,325 @@
 """LED-style status indicator with subtle glow."""
 
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Property
-from PySide6.QtGui import QPainter, QColor, QRadialGradient, QPen
+import time
+import weakref
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Optional
+
+from PySide6.QtCore import Qt, QRect, QTimer
+from PySide6.QtGui import QPainter, QColor, QRadialGradient, QPen, QPixmap
 from PySide6.QtWidgets import QWidget, QSizePolicy
 
+# Number of distinct intensity steps shown during on/off transitions; at
+# 12 px more steps are not visibly smoother
+INTENSITY_LEVELS = 8
+
+# On/off transition length, and the tick rate of the timer that drives it
+FADE_DURATION = 0.15  # seconds
+FADE_INTERVAL_MS = 33
+
+
+class LEDPreset(IntEnum):
+    """Indices of the preset LED colors in _PRESET_RGB."""
+    OFF = 0
+    GREEN = 1
+    RED = 2
+    YELLOW = 3
+    BLUE = 4
+
+
+# (r, g, b) of each preset, indexed by LEDPreset
+_PRESET_RGB: tuple[tuple[int, int, int], ...] = (
+    (60, 60, 65),
+    (80, 200, 100),
+    (220, 80, 80),
+    (220, 200, 80),
+    (80, 160, 220),
+)
+_OFF_R, _OFF_G, _OFF_B = _PRESET_RGB[LEDPreset.OFF]
+
+# Lighter/darker body shades keyed by base rgb, so the HSV round-trip in
+# QColor.lighter()/darker() runs once per distinct color
+_shade_cache: dict[int, tuple[QColor, QColor]] = {}
+
+
+def _shades(color: QColor) -> tuple[QColor, QColor]:
+    """Return the (lighter, darker) shades used for the LED body gradient."""
+    rgb = color.rgb()
+    shades = _shade_cache.get(rgb)
+    if shades is None:
+        shades = (color.lighter(140), color.darker(140))
+        _shade_cache[rgb] = shades
+    return shades
+
+
+# Nesting depth of batch_led_updates() and the LEDs waiting for its exit
+_batch_depth = 0
+_pending: set["LEDIndicator"] = set()
+
+
+@contextmanager
+def batch_led_updates():
+    """
+    Defer LED color and on/off changes until the outermost block exits.
+
+    Each LED then applies only its final color and state, with a single
+    repaint or animation, however many times it was changed in the block.
+    """
+    global _batch_depth
+    _batch_depth += 1
+    try:
+        yield
+    finally:
+        _batch_depth -= 1
+        if _batch_depth == 0:
+            leds = list(_pending)
+            _pending.clear()
+            for led in leds:
+                led._flush()
+
+
+def _place_gradient(gradient: QRadialGradient, x: float, y: float, radius: float):
+    """Center a reused radial gradient, with its focal point, at (x, y)."""
+    gradient.setCenter(x, y)
+    gradient.setFocalPoint(x, y)
+    gradient.setRadius(radius)
+
 
 class LEDIndicator(QWidget):
     """A subtle LED indicator with customizable color and glow."""
 
     # Preset colors
-    COLOR_OFF = QColor(60, 60, 65)
-    COLOR_GREEN = QColor(80, 200, 100)
-    COLOR_RED = QColor(220, 80, 80)
-    COLOR_YELLOW = QColor(220, 200, 80)
-    COLOR_BLUE = QColor(80, 160, 220)
+    COLOR_OFF = QColor(*_PRESET_RGB[LEDPreset.OFF])
+    COLOR_GREEN = QColor(*_PRESET_RGB[LEDPreset.GREEN])
+    COLOR_RED = QColor(*_PRESET_RGB[LEDPreset.RED])
+    COLOR_YELLOW = QColor(*_PRESET_RGB[LEDPreset.YELLOW])
+    COLOR_BLUE = QColor(*_PRESET_RGB[LEDPreset.BLUE])
+
+    # Drawing objects reused by every render
+    _BORDER_PEN = QPen(QColor(30, 30, 35), 1)
+    _NO_PEN = QPen(Qt.PenStyle.NoPen)
+    _HIGHLIGHT_CLEAR = QColor(255, 255, 255, 0)
+
+    # Gradients reused by every render; only geometry and stops change.
+    # setBrush copies them, so mutating after drawing is safe.
+    _GLOW_GRAD = QRadialGradient()
+    _BODY_GRAD = QRadialGradient()
+    _HIGHLIGHT_GRAD = QRadialGradient()
+
+    # Pre-rendered LED images keyed by (rgb, intensity level, width, height,
+    # device pixel ratio), shared by all indicators
+    _pixmap_cache: dict[tuple[int, int, int, int, float], QPixmap] = {}
 
-    def __init__(self, parent=None, color: QColor = None):
+    # The off state looks the same for every color, so it is cached once
+    # per (width, height, device pixel ratio)
+    _off_pixmaps: dict[tuple[int, int, float], QPixmap] = {}
+
+    # One timer steps every fading LED, instead of an animation per LED.
+    # Created on first use, once a QApplication exists.
+    _fade_timer: Optional[QTimer] = None
+    _fading: "weakref.WeakSet[LEDIndicator]" = weakref.WeakSet()
+
+    def __init__(self, parent=None, color: QColor | LEDPreset = None):
         super().__init__(parent)
 
-        self._color = color or self.COLOR_OFF
+        self._color = self.COLOR_OFF
+        self._dr = self._dg = self._db = 0
+        if color is not None:
+            self._apply_color(color)
         self._on = False
+        self._pending_color: QColor | LEDPreset | None = None
+        self._pending_on: bool | None = None
         self._intensity = 0.0
+        self._level = 0  # _intensity quantized to INTENSITY_LEVELS
 
-        # Animation for smooth on/off transitions
-        self._animation = QPropertyAnimation(self, b"intensity")
-        self._animation.setDuration(150)
-        self._animation.setEasingCurve(QEasingCurve.OutCubic)
+        # Current on/off transition: start time, start and end intensity
+        self._fade_start = 0.0
+        self._fade_from = 0.0
+        self._fade_to = 0.0
 
         self.setFixedSize(12, 12)
         self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
 
-    def set_color(self, color: QColor):
-        """Set the LED color."""
-        self._color = color
+    def set_color(self, color: QColor | LEDPreset):
+        """Set the LED color, either a QColor or one of the LEDPreset colors."""
+        if _batch_depth:
+            self._pending_color = color
+            _pending.add(self)
+            return
+        self._apply_color(color)
         self.update()
 
+    def _apply_color(self, color: QColor | LEDPreset):
+        """Store the color and its per-channel distance from the off color."""
+        if isinstance(color, LEDPreset):
+            r, g, b = _PRESET_RGB[color]
+            color = QColor(r, g, b)
+        else:
+            r, g, b = color.red(), color.green(), color.blue()
+        self._color = color
+        self._dr = r - _OFF_R
+        self._dg = g - _OFF_G
+        self._db = b - _OFF_B
+
     def set_on(self, on: bool):
         """Turn the LED on or off with animation."""
+        if _batch_depth:
+            self._pending_on = on
+            _pending.add(self)
+            return
         if self._on != on:
             self._on = on
-            self._animation.stop()
-            self._animation.setStartValue(self._intensity)
-            self._animation.setEndValue(1.0 if on else 0.0)
-            self._animation.start()
+            self._fade_start = time.monotonic()
+            self._fade_from = self._intensity
+            self._fade_to = 1.0 if on else 0.0
+            self._start_fade()
 
     def is_on(self) -> bool:
-        return self._on
+        return self._on if self._pending_on is None else self._pending_on
+
+    def _flush(self):
+        """Apply the color and state recorded during a batch."""
+        color, on = self._pending_color, self._pending_on
+        self._pending_color = self._pending_on = None
+        if color is not None:
+            self.set_color(color)
+        if on is not None:
+            self.set_on(on)
+
+    def _start_fade(self):
+        """Register this LED with the shared fade timer."""
+        cls = LEDIndicator
+        if cls._fade_timer is None:
+            cls._fade_timer = QTimer()
+            cls._fade_timer.setInterval(FADE_INTERVAL_MS)
+            cls._fade_timer.timeout.connect(cls._advance_fades)
+        cls._fading.add(self)
+        if not cls._fade_timer.isActive():
+            cls._fade_timer.start()
+
+    @classmethod
+    def _advance_fades(cls):
+        """Step every fading LED along an ease-out cubic curve."""
+        now = time.monotonic()
+        for led in list(cls._fading):
+            try:
+                t = min(1.0, (now - led._fade_start) / FADE_DURATION)
+                eased = 1.0 - (1.0 - t) ** 3
+                led.set_intensity(led._fade_from + (led._fade_to - led._fade_from) * eased)
+            except RuntimeError:  # Underlying widget already deleted
+                t = 1.0
+            if t >= 1.0:
+                cls._fading.discard(led)
+        if not cls._fading:
+            cls._fade_timer.stop()
 
-    # Qt Property for animation
     def get_intensity(self) -> float:
         return self._intensity
 
     def set_intensity(self, value: float):
-        self._intensity = value
+        # Only repaint when the animation crosses into a new visible step
+        level = round(value * INTENSITY_LEVELS)
+        if level == self._level:
+            return
+        self._level = level
+        self._intensity = level / INTENSITY_LEVELS
         self.update()
 
-    intensity = Property(float, get_intensity, set_intensity)
-
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        dpr = self.devicePixelRatioF()
+
+        # Idle LEDs skip the color key entirely
+        if self._level == 0:
+            painter.drawPixmap(0, 0, self._get_off_pixmap(dpr))
+            return
+
+        key = (self._color.rgb(), self._level, self.width(), self.height(), dpr)
+        pixmap = self._pixmap_cache.get(key)
+        if pixmap is None:
+            pixmap = self._render_pixmap(self._intensity, dpr)
+            self._pixmap_cache[key] = pixmap
+        painter.drawPixmap(0, 0, pixmap)
 
+    def _get_off_pixmap(self, dpr: float) -> QPixmap:
+        """Return the shared image of an unlit LED at this size."""
+        key = (self.width(), self.height(), dpr)
+        pixmap = self._off_pixmaps.get(key)
+        if pixmap is None:
+            pixmap = self._render_pixmap(0.0, dpr)
+            self._off_pixmaps[key] = pixmap
+        return pixmap
+
+    def _render_pixmap(self, intensity: float, dpr: float) -> QPixmap:
+        """Draw the LED at the given intensity into a transparent pixmap."""
         w = self.width()
         h = self.height()
+
+        pixmap = QPixmap(round(w * dpr), round(h * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
         cx = w // 2
         cy = h // 2
         radius = min(w, h) // 2 - 1
 
+        # Whole-pixel rectangles for the glow, body and highlight spot
+        glow_r = round(radius * 1.5)
+        glow_rect = QRect(cx - glow_r, cy - glow_r, glow_r * 2, glow_r * 2)
+        body_rect = QRect(cx - radius, cy - radius, radius * 2, radius * 2)
+        spot_offset = round(radius * 0.6)
+        spot_size = round(radius * 0.8)
+        spot_rect = QRect(cx - spot_offset, cy - spot_offset, spot_size, spot_size)
+
         # Interpolate between off and on color
-        if self._intensity > 0:
-            r = int(self.COLOR_OFF.red() + (self._color.red() - self.COLOR_OFF.red()) * self._intensity)
-            g = int(self.COLOR_OFF.green() + (self._color.green() - self.COLOR_OFF.green()) * self._intensity)
-            b = int(self.COLOR_OFF.blue() + (self._color.blue() - self.COLOR_OFF.blue()) * self._intensity)
-            current_color = QColor(r, g, b)
+        if intensity > 0:
+            current_color = QColor(
+                _OFF_R + int(self._dr * intensity),
+                _OFF_G + int(self._dg * intensity),
+                _OFF_B + int(self._db * intensity),
+            )
         else:
             current_color = self.COLOR_OFF
 
         # Subtle outer glow when on
-        if self._intensity > 0.3:
-            glow_opacity = (self._intensity - 0.3) * 0.3
-            glow = QRadialGradient(cx, cy, radius * 1.8)
+        if intensity > 0.3:
+            glow_opacity = (intensity - 0.3) * 0.3
+            glow = self._GLOW_GRAD
+            _place_gradient(glow, cx, cy, radius * 1.8)
             glow_color = QColor(current_color)
             glow_color.setAlphaF(glow_opacity)
-            glow.setColorAt(0.3, glow_color)
-            glow.setColorAt(1.0, QColor(current_color.red(), current_color.green(), current_color.blue(), 0))
+            glow_clear = QColor(current_color)
+            glow_clear.setAlpha(0)
+            glow.setStops([(0.3, glow_color), (1.0, glow_clear)])
             painter.setBrush(glow)
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawEllipse(cx - radius * 1.5, cy - radius * 1.5,
-                               radius * 3, radius * 3)
+            painter.setPen(self._NO_PEN)
+            painter.drawEllipse(glow_rect)
 
         # LED body gradient (3D effect)
-        led_gradient = QRadialGradient(cx - radius * 0.3, cy - radius * 0.3, radius * 1.2)
-        led_gradient.setColorAt(0.0, current_color.lighter(140))
-        led_gradient.setColorAt(0.5, current_color)
-        led_gradient.setColorAt(1.0, current_color.darker(140))
+        led_gradient = self._BODY_GRAD
+        _place_gradient(led_gradient, cx - radius * 0.3, cy - radius * 0.3, radius * 1.2)
+        lighter, darker = _shades(current_color)
+        led_gradient.setStops([(0.0, lighter), (0.5, current_color), (1.0, darker)])
 
         # Border
-        border_color = QColor(30, 30, 35)
-        painter.setPen(QPen(border_color, 1))
+        painter.setPen(self._BORDER_PEN)
         painter.setBrush(led_gradient)
-        painter.drawEllipse(cx - radius, cy - radius, radius * 2, radius * 2)
+        painter.drawEllipse(body_rect)
 
         # Highlight spot
-        if self._intensity > 0.2:
-            highlight = QRadialGradient(cx - radius * 0.3, cy - radius * 0.3, radius * 0.5)
-            highlight.setColorAt(0.0, QColor(255, 255, 255, int(60 * self._intensity)))
-            highlight.setColorAt(1.0, QColor(255, 255, 255, 0))
+        if intensity > 0.2:
+            highlight = self._HIGHLIGHT_GRAD
+            _place_gradient(highlight, cx - radius * 0.3, cy - radius * 0.3, radius * 0.5)
+            highlight_color = QColor(self._HIGHLIGHT_CLEAR)
+            highlight_color.setAlpha(int(60 * intensity))
+            highlight.setStops([(0.0, highlight_color), (1.0, self._HIGHLIGHT_CLEAR)])
             painter.setBrush(highlight)
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawEllipse(cx - radius * 0.6, cy - radius * 0.6,
-                               radius * 0.8, radius * 0.8)
+            painter.setPen(self._NO_PEN)
+            painter.drawEllipse(spot_rect)
+
+        painter.end()
+        return pixmap
@@ -1,13 +1,61 @@
 """VU-style audio level meter with smooth animation."""
 
-from PySide6.QtCore import (
-    Qt, QPropertyAnimation, QEasingCurve, Property, QTimer
-)
+import math
+
+from PySide6.QtCore import Qt, QTimer, QRect
 from PySide6.QtGui import (
-    QPainter, QColor, QLinearGradient, QPen, QBrush
+    QPainter, QColor, QLinearGradient, QPen, QBrush, QPixmap, QPainterPath
 )
 from PySide6.QtWidgets import QWidget, QSizePolicy
 
+# One animation frame drives the bar and the peak indicator together
+TICK_INTERVAL_MS = 16
+
+# Exponential approach rates, 1/s: the bar rises fast and falls slower,
+# and the peak indicator lingers longest
+RISE_RATE = 40.0
+FALL_RATE = 8.0
+PEAK_FALL_RATE = 2.0
+
+# The peak line is hidden below this level
+PEAK_MIN = 0.02
+
+# Per-tick decay factors, so a frame is a single multiply-add
+_RISE_ALPHA = math.exp(-RISE_RATE * TICK_INTERVAL_MS / 1000)
+_FALL_ALPHA = math.exp(-FALL_RATE * TICK_INTERVAL_MS / 1000)
+_PEAK_ALPHA = math.exp(-PEAK_FALL_RATE * TICK_INTERVAL_MS / 1000)
+
+# Gradient stops, built once at import
+_BG_STOPS = (
+    (0.0, QColor(20, 20, 22)),
+    (0.3, QColor(28, 28, 32)),
+    (1.0, QColor(35, 35, 40)),
+)
+# Level bar - green (0-60%) to yellow (60-80%) to red (80-100%)
+_LEVEL_STOPS = (
+    (0.0, QColor(60, 180, 80)),
+    (0.4, QColor(80, 190, 70)),
+    (0.6, QColor(200, 200, 60)),
+    (0.75, QColor(230, 180, 50)),
+    (0.85, QColor(230, 120, 50)),
+    (1.0, QColor(220, 70, 60)),
+)
+_SHINE_STOPS = (
+    (0.0, QColor(255, 255, 255, 40)),
+    (1.0, QColor(255, 255, 255, 0)),
+)
+
+# Peak line pens, indexed by the colour band from _peak_state()
+_PEAK_PENS = (
+    QPen(QColor(120, 220, 120, 200), 2),
+    QPen(QColor(255, 220, 80, 200), 2),
+    QPen(QColor(255, 80, 80, 200), 2),
+)
+
+_BORDER_PEN = QPen(QColor(15, 15, 18), 1)
+_INNER_SHADOW_PEN = QPen(QColor(0, 0, 0, 40), 1)
+_TICK_PEN = QPen(QColor(0, 0, 0, 60), 1)
+
 
 class LevelMeter(QWidget):
     """A sleek VU-style level meter with smooth falloff."""
@@ -19,20 +67,22 @@ class LevelMeter(QWidget):
         self._peak_level = 0.0
         self._display_level = 0.0
 
-        # Smooth animation for level changes
-        self._level_animation = QPropertyAnimation(self, b"display_level")
-        self._level_animation.setDuration(80)
-        self._level_animation.setEasingCurve(QEasingCurve.OutCubic)
-
-        # Peak hold timer
-        self._peak_timer = QTimer(self)
-        self._peak_timer.timeout.connect(self._decay_peak)
-        self._peak_timer.setInterval(50)
-
-        # Falloff timer for smooth decay
-        self._falloff_timer = QTimer(self)
-        self._falloff_timer.timeout.connect(self._decay_level)
-        self._falloff_timer.setInterval(30)
+        # Animation tick, only running while the bar or peak is moving
+        self._tick = QTimer(self)
+        self._tick.setInterval(TICK_INTERVAL_MS)
+        self._tick.timeout.connect(self._advance)
+
+        # Size-dependent geometry and the static layers, rebuilt on resize
+        self._margin = 2
+        self._cached_size = None
+        self._bg_pixmap: QPixmap | None = None
+        self._tick_pixmap: QPixmap | None = None
+        self._bar_width = 0
+        self._bar_height = 0
+        self._bar_inner_width = 0
+        self._tick_xs: list[int] = []
+        self._level_brush = QBrush()
+        self._shine_brush = QBrush()
 
         self.setMinimumSize(200, 24)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
@@ -41,139 +91,184 @@ class LevelMeter(QWidget):
         """Set the current level (0.0 to 1.0)."""
         level = max(0.0, min(1.0, level))
 
-        if level > self._display_level:
-            # Rising - animate quickly
-            self._level_animation.stop()
-            self._level_animation.setStartValue(self._display_level)
-            self._level_animation.setEndValue(level)
-            self._level_animation.setDuration(50)
-            self._level_animation.start()
-
-            # Update peak
-            if level > self._peak_level:
-                self._peak_level = level
-
-            # Start falloff timer
-            if not self._falloff_timer.isActive():
-                self._falloff_timer.start()
-            if not self._peak_timer.isActive():
-                self._peak_timer.start()
+        # Update peak
+        if level > self._peak_level:
+            self._set_peak_level(level)
 
         self._level = level
+        if (level != self._display_level or self._peak_level > 0) and not self._tick.isActive():
+            self._tick.start()
+
+    def _advance(self):
+        """Move the bar and peak indicator one frame towards the input level."""
+        display = self._display_level
+        target = self._level
+
+        if display != target:
+            alpha = _RISE_ALPHA if display < target else _FALL_ALPHA
+            display = target + (display - target) * alpha
+            # Snap once the rest of the way is less than a pixel
+            if abs(display - target) * self._bar_inner_width < 1:
+                display = target
+            self._set_display_level(display)
 
-    def _decay_level(self):
-        """Smooth decay when input level drops."""
-        if self._display_level > self._level:
-            new_level = self._display_level - 0.03
-            if new_level <= self._level:
-                self._display_level = self._level
-                if self._level == 0:
-                    self._falloff_timer.stop()
-            else:
-                self._display_level = new_level
-            self.update()
-
-    def _decay_peak(self):
-        """Decay the peak indicator."""
         if self._peak_level > 0:
-            self._peak_level = max(0, self._peak_level - 0.015)
-            self.update()
-        else:
-            self._peak_timer.stop()
+            peak = self._peak_level * _PEAK_ALPHA
+            self._set_peak_level(peak if peak > PEAK_MIN else 0.0)
+
+        if display == target and self._peak_level == 0:
+            self._tick.stop()
+
+    def _set_display_level(self, value: float):
+        """Move the level bar, repainting only the columns that changed."""
+        old_px = self._level_px(self._display_level)
+        self._display_level = value
+        new_px = self._level_px(value)
+        if old_px == new_px or self._cached_size is None:
+            return
+
+        # Bars narrower than 3px are not drawn at all, so repaint from the start
+        lo = min(old_px, new_px)
+        lo = 0 if lo <= 2 else lo - 2
+        x = self._margin + 2 + lo
+        self.update(x, 0, max(old_px, new_px) - lo + 3, self.height())
+
+    def _set_peak_level(self, value: float):
+        """Move the peak line, repainting only its old and new positions."""
+        old_state = self._peak_state(self._peak_level)
+        self._peak_level = value
+        new_state = self._peak_state(value)
+        if old_state == new_state or self._cached_size is None:
+            return
+
+        for state in (old_state, new_state):
+            if state is not None:
+                self.update(self._peak_rect(state[0]))
+
+    def _level_px(self, level: float) -> int:
+        return int(level * self._bar_inner_width)
+
+    def _peak_state(self, peak: float):
+        """Return the painted (x, colour band) of the peak line, or None if hidden."""
+        if peak <= PEAK_MIN:
+            return None
+        x = self._margin + 2 + int(peak * (self._bar_width - 6))
+        band = 2 if peak > 0.85 else 1 if peak > 0.6 else 0
+        return x, band
+
+    def _peak_rect(self, peak_x: int) -> QRect:
+        return QRect(peak_x - 2, 0, 5, self.height())
 
     def reset(self):
         """Reset the meter to zero."""
         self._level = 0.0
         self._peak_level = 0.0
         self._display_level = 0.0
-        self._falloff_timer.stop()
-        self._peak_timer.stop()
+        self._tick.stop()
         self.update()
 
-    # Qt Property for animation
-    def get_display_level(self) -> float:
-        return self._display_level
-
-    def set_display_level(self, value: float):
-        self._display_level = value
-        self.update()
-
-    display_level = Property(float, get_display_level, set_display_level)
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._rebuild_cache()
 
+    def _rebuild_cache(self):
+        """Precompute geometry and render the static background and ticks."""
+        self._cached_size = (self.size(), self.devicePixelRatioF())
+        margin = self._margin
         w = self.width()
         h = self.height()
-        margin = 2
-        bar_height = h - margin * 2
-        bar_width = w - margin * 2
+        self._bar_width = w - margin * 2
+        self._bar_height = h - margin * 2
+        self._bar_inner_width = self._bar_width - 4
+        self._tick_xs = [margin + 2 + int((i / 10) * self._bar_inner_width)
+                         for i in range(1, 10)]
 
         # Background - recessed look
+        self._bg_pixmap = self._new_pixmap()
+        painter = QPainter(self._bg_pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
         bg_gradient = QLinearGradient(0, margin, 0, h - margin)
-        bg_gradient.setColorAt(0.0, QColor(20, 20, 22))
-        bg_gradient.setColorAt(0.3, QColor(28, 28, 32))
-        bg_gradient.setColorAt(1.0, QColor(35, 35, 40))
+        bg_gradient.setStops(_BG_STOPS)
 
-        painter.setPen(QPen(QColor(15, 15, 18), 1))
+        painter.setPen(_BORDER_PEN)
         painter.setBrush(QBrush(bg_gradient))
-        painter.drawRoundedRect(margin, margin, bar_width, bar_height, 4, 4)
+        painter.drawRoundedRect(margin, margin, self._bar_width, self._bar_height, 4, 4)
 
         # Inner shadow effect
-        painter.setPen(QPen(QColor(0, 0, 0, 40), 1))
-        painter.drawLine(margin + 2, margin + 1, margin + bar_width - 2, margin + 1)
+        painter.setPen(_INNER_SHADOW_PEN)
+        painter.drawLine(margin + 2, margin + 1, margin + self._bar_width - 2, margin + 1)
+        painter.end()
+
+        # Segment lines (subtle tick marks), drawn above the level bar as a
+        # single path rather than one line per tick end
+        ticks_path = QPainterPath()
+        for x in self._tick_xs:
+            ticks_path.moveTo(x, margin + 2)
+            ticks_path.lineTo(x, margin + 5)
+            ticks_path.moveTo(x, h - margin - 5)
+            ticks_path.lineTo(x, h - margin - 2)
+
+        self._tick_pixmap = self._new_pixmap()
+        painter = QPainter(self._tick_pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(_TICK_PEN)
+        painter.drawPath(ticks_path)
+        painter.end()
+
+        # The bar gradients span the full bar; only the drawn width varies
+        level_gradient = QLinearGradient(margin + 2, 0, margin + self._bar_width - 2, 0)
+        level_gradient.setStops(_LEVEL_STOPS)
+        self._level_brush = QBrush(level_gradient)
+
+        shine_gradient = QLinearGradient(0, margin + 2, 0, margin + self._bar_height // 2)
+        shine_gradient.setStops(_SHINE_STOPS)
+        self._shine_brush = QBrush(shine_gradient)
+
+    def _new_pixmap(self) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        return pixmap
 
-        # Calculate level width
-        level_width = int(self._display_level * (bar_width - 4))
+    def paintEvent(self, event):
+        if self._cached_size != (self.size(), self.devicePixelRatioF()):
+            self._rebuild_cache()
 
-        if level_width > 2:
-            # Level gradient - green to yellow to red
-            level_gradient = QLinearGradient(margin + 2, 0, margin + bar_width - 2, 0)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-            # Green zone (0-60%)
-            level_gradient.setColorAt(0.0, QColor(60, 180, 80))
-            level_gradient.setColorAt(0.4, QColor(80, 190, 70))
+        h = self.height()
+        margin = self._margin
+        bar_height = self._bar_height
+        dirty = event.rect()
 
-            # Yellow zone (60-80%)
-            level_gradient.setColorAt(0.6, QColor(200, 200, 60))
-            level_gradient.setColorAt(0.75, QColor(230, 180, 50))
+        painter.drawPixmap(0, 0, self._bg_pixmap)
 
-            # Red zone (80-100%)
-            level_gradient.setColorAt(0.85, QColor(230, 120, 50))
-            level_gradient.setColorAt(1.0, QColor(220, 70, 60))
+        # Calculate level width
+        level_width = self._level_px(self._display_level)
 
+        if level_width > 2 and dirty.left() <= margin + 3 + level_width:
+            # Level gradient - green to yellow to red
             painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QBrush(level_gradient))
+            painter.setBrush(self._level_brush)
             painter.drawRoundedRect(margin + 2, margin + 2,
                                    level_width, bar_height - 4, 2, 2)
 
             # Subtle shine on top of level bar
-            shine_gradient = QLinearGradient(0, margin + 2, 0, margin + bar_height // 2)
-            shine_gradient.setColorAt(0.0, QColor(255, 255, 255, 40))
-            shine_gradient.setColorAt(1.0, QColor(255, 255, 255, 0))
-            painter.setBrush(QBrush(shine_gradient))
+            painter.setBrush(self._shine_brush)
             painter.drawRoundedRect(margin + 2, margin + 2,
                                    level_width, (bar_height - 4) // 2, 2, 2)
 
         # Peak indicator
-        if self._peak_level > 0.02:
-            peak_x = margin + 2 + int(self._peak_level * (bar_width - 6))
-
+        peak_state = self._peak_state(self._peak_level)
+        if peak_state is not None and dirty.intersects(self._peak_rect(peak_state[0])):
             # Peak line color based on level
-            if self._peak_level > 0.85:
-                peak_color = QColor(255, 80, 80, 200)
-            elif self._peak_level > 0.6:
-                peak_color = QColor(255, 220, 80, 200)
-            else:
-                peak_color = QColor(120, 220, 120, 200)
-
-            painter.setPen(QPen(peak_color, 2))
+            peak_x, band = peak_state
+            painter.setPen(_PEAK_PENS[band])
             painter.drawLine(peak_x, margin + 3, peak_x, h - margin - 3)
 
-        # Segment lines (subtle tick marks)
-        painter.setPen(QPen(QColor(0, 0, 0, 60), 1))
-        for i in range(1, 10):
-            x = margin + 2 + int((i / 10) * (bar_width - 4))
-            painter.drawLine(x, margin + 2, x, margin + 5)
-            painter.drawLine(x, h - margin - 5, x, h - margin - 2)
+        # Antialiased 1px ticks bleed into the neighbouring column
+        if any(dirty.left() - 1 <= x <= dirty.right() + 1 for x in self._tick_xs):
+            painter.drawPixmap(0, 0, self._tick_pixmap)
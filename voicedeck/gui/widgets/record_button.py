@@ -1,14 +1,56 @@
 """Custom animated record button with metallic 3D appearance."""
 
 from PySide6.QtCore import (
-    Qt, QPropertyAnimation, QEasingCurve, Property, QTimer, Signal
+    Qt, QPropertyAnimation, QEasingCurve, Property, QTimer, Signal, QRect, QEvent
 )
 from PySide6.QtGui import (
     QPainter, QColor, QLinearGradient, QRadialGradient,
-    QPen, QBrush, QPainterPath
+    QPen, QBrush, QRegion, QPixmap, QFont
 )
 from PySide6.QtWidgets import QAbstractButton, QSizePolicy
 
+# Body colours per recording state: (base, highlight, shadow)
+_BODY_COLORS = {
+    True: (QColor(140, 45, 55), QColor(180, 60, 70), QColor(90, 30, 40)),  # Deep red
+    False: (QColor(45, 85, 45), QColor(60, 110, 60), QColor(30, 60, 30)),  # Deep green
+}
+
+
+def _body_stops(recording: bool, pressed: bool) -> tuple:
+    base_color, highlight_color, shadow_color = _BODY_COLORS[recording]
+    if pressed:
+        # Pressed state - darker, inverted gradient
+        return (
+            (0.0, shadow_color),
+            (0.5, base_color),
+            (1.0, highlight_color.darker(110)),
+        )
+    # Normal state - 3D bevel effect
+    return (
+        (0.0, highlight_color),
+        (0.15, base_color),
+        (0.85, base_color.darker(105)),
+        (1.0, shadow_color),
+    )
+
+
+# Metallic body gradient stops and border pen, keyed by (recording, pressed)
+_BODY_STOPS = {
+    (recording, pressed): _body_stops(recording, pressed)
+    for recording in (True, False)
+    for pressed in (True, False)
+}
+_BORDER_PENS = {
+    recording: QPen(colors[2].darker(130), 1)
+    for recording, colors in _BODY_COLORS.items()
+}
+
+# Outer glow and indicator dot colours; alpha is set per frame on a copy
+_GLOW_COLORS = {True: QColor(255, 80, 80), False: QColor(100, 200, 100)}
+_DOT_COLOR = QColor(255, 100, 100)
+_DOT_GLOW_STOPS = ((0.0, QColor(255, 100, 100, 60)), (1.0, QColor(255, 100, 100, 0)))
+_IDLE_DOT_COLOR = QColor(120, 180, 120, 180)
+
 
 class RecordButton(QAbstractButton):
     """A sleek metallic record button with animated states."""
@@ -16,6 +58,13 @@ class RecordButton(QAbstractButton):
     # Custom signal for recording state
     recordingToggled = Signal(bool)
 
+    # Drawing objects reused by every render
+    _HIGHLIGHT_PEN = QPen(QColor(255, 255, 255, 30), 1)
+    _TEXT_PENS = {
+        True: QPen(QColor(255, 220, 220)),
+        False: QPen(QColor(220, 255, 220)),
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -38,6 +87,13 @@ class RecordButton(QAbstractButton):
         self._glow_animation.setDuration(150)
         self._glow_animation.setEasingCurve(QEasingCurve.OutCubic)
 
+        # Rendered body, label and static dot parts, keyed by
+        # (recording, pressed, width, height, device pixel ratio)
+        self._cache: dict[tuple, QPixmap] = {}
+
+        # Label font, derived from the widget font once rather than per render
+        self._font = self._label_font()
+
         # Size policy
         self.setMinimumSize(180, 50)
         self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
@@ -70,7 +126,8 @@ class RecordButton(QAbstractButton):
 
     def set_pulse_value(self, value: float):
         self._pulse_value = value
-        self.update()
+        # The pulse only animates the outer glow ring and the indicator dot
+        self.update(self._ring_region().united(self._dot_rect()))
 
     pulse_value = Property(float, get_pulse_value, set_pulse_value)
 
@@ -80,7 +137,7 @@ class RecordButton(QAbstractButton):
 
     def set_glow_opacity(self, value: float):
         self._glow_opacity = value
-        self.update()
+        self.update(self._ring_region())
 
     glow_opacity = Property(float, get_glow_opacity, set_glow_opacity)
 
@@ -110,10 +167,39 @@ class RecordButton(QAbstractButton):
         self.update()
         super().mouseReleaseEvent(event)
 
+    def _ring_region(self) -> QRegion:
+        """Region covered by the outer glow, including its rounded corners."""
+        rect = self.rect()
+        return QRegion(rect).subtracted(QRegion(rect.adjusted(7, 7, -7, -7)))
+
+    def _dot_rect(self) -> QRect:
+        """Bounding box of the recording indicator dot and its glow."""
+        margin = 2
+        dot_x = margin + 18
+        dot_y = self.height() // 2 + (1 if self._pressed else 0)
+        return QRect(dot_x - 11, dot_y - 11, 23, 23)
+
     def sizeHint(self):
         from PySide6.QtCore import QSize
         return QSize(180, 50)
 
+    def _label_font(self) -> QFont:
+        font = QFont(self.font())
+        font.setPixelSize(14)
+        font.setWeight(QFont.Weight.Medium)
+        return font
+
+    def changeEvent(self, event):
+        # The stylesheet sets the font family after construction
+        if event.type() == QEvent.Type.FontChange:
+            self._font = self._label_font()
+            self._cache.clear()
+        super().changeEvent(event)
+
+    def resizeEvent(self, event):
+        self._cache.clear()
+        super().resizeEvent(event)
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
@@ -122,24 +208,6 @@ class RecordButton(QAbstractButton):
         h = self.height()
         margin = 2
 
-        # Colors based on state
-        if self._recording:
-            base_color = QColor(140, 45, 55)  # Deep red
-            highlight_color = QColor(180, 60, 70)
-            shadow_color = QColor(90, 30, 40)
-            text_color = QColor(255, 220, 220)
-            glow_color = QColor(255, 80, 80)
-        else:
-            base_color = QColor(45, 85, 45)  # Deep green
-            highlight_color = QColor(60, 110, 60)
-            shadow_color = QColor(30, 60, 30)
-            text_color = QColor(220, 255, 220)
-            glow_color = QColor(100, 200, 100)
-
-        # Outer shadow/bevel
-        outer_rect = QPainterPath()
-        outer_rect.addRoundedRect(margin, margin, w - margin * 2, h - margin * 2, 8, 8)
-
         # Draw subtle outer glow when hovering or recording
         if self._glow_opacity > 0 or (self._recording and self._pulse_value > 0):
             glow_strength = self._glow_opacity
@@ -148,43 +216,65 @@ class RecordButton(QAbstractButton):
                 pulse_glow = 0.15 + (self._pulse_value * 0.15)
                 glow_strength = max(glow_strength, pulse_glow)
 
+            glow_color = QColor(_GLOW_COLORS[self._recording])
             glow_color.setAlphaF(glow_strength * 0.5)
+            # A fresh painter has no brush, so the ring only needs its pen
             painter.setPen(QPen(glow_color, 3))
-            painter.setBrush(Qt.BrushStyle.NoBrush)
             painter.drawRoundedRect(margin - 1, margin - 1, w - margin * 2 + 2, h - margin * 2 + 2, 9, 9)
 
+        # Everything that doesn't animate comes from the cache
+        dpr = self.devicePixelRatioF()
+        key = (self._recording, self._pressed, w, h, dpr)
+        pixmap = self._cache.get(key)
+        if pixmap is None:
+            pixmap = self._render_static(dpr)
+            self._cache[key] = pixmap
+        painter.drawPixmap(0, 0, pixmap)
+
+        if self._recording:
+            # Animated red dot
+            dot_x = margin + 18
+            dot_y = h // 2 + (1 if self._pressed else 0)
+            dot_radius = 5
+
+            dot_opacity = 0.7 + (self._pulse_value * 0.3)
+            dot_color = QColor(_DOT_COLOR)
+            dot_color.setAlphaF(dot_opacity)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(dot_color)
+            painter.drawEllipse(dot_x - dot_radius, dot_y - dot_radius,
+                              dot_radius * 2, dot_radius * 2)
+
+    def _render_static(self, dpr: float) -> QPixmap:
+        """Render the button body, label and the non-animated dot parts."""
+        w = self.width()
+        h = self.height()
+        margin = 2
+
+        pixmap = QPixmap(round(w * dpr), round(h * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
         # Main button gradient (metallic effect)
         button_gradient = QLinearGradient(0, margin, 0, h - margin)
+        button_gradient.setStops(_BODY_STOPS[(self._recording, self._pressed)])
 
-        if self._pressed:
-            # Pressed state - darker, inverted gradient
-            button_gradient.setColorAt(0.0, shadow_color)
-            button_gradient.setColorAt(0.5, base_color)
-            button_gradient.setColorAt(1.0, highlight_color.darker(110))
-        else:
-            # Normal state - 3D bevel effect
-            button_gradient.setColorAt(0.0, highlight_color)
-            button_gradient.setColorAt(0.15, base_color)
-            button_gradient.setColorAt(0.85, base_color.darker(105))
-            button_gradient.setColorAt(1.0, shadow_color)
-
-        painter.setPen(QPen(shadow_color.darker(130), 1))
+        painter.setPen(_BORDER_PENS[self._recording])
         painter.setBrush(QBrush(button_gradient))
         painter.drawRoundedRect(margin, margin, w - margin * 2, h - margin * 2, 8, 8)
 
         # Inner highlight line (subtle top edge shine)
         if not self._pressed:
-            highlight_pen = QPen(QColor(255, 255, 255, 30), 1)
-            painter.setPen(highlight_pen)
+            painter.setPen(self._HIGHLIGHT_PEN)
             painter.drawLine(margin + 10, margin + 2, w - margin - 10, margin + 2)
 
         # Draw text
         text = "Stop Recording" if self._recording else "Start Recording"
-        painter.setPen(text_color)
-        font = painter.font()
-        font.setPixelSize(14)
-        font.setWeight(font.Weight.Medium)
-        painter.setFont(font)
+        painter.setPen(self._TEXT_PENS[self._recording])
+        painter.setFont(self._font)
 
         # Offset text slightly when pressed
         text_offset = 1 if self._pressed else 0
@@ -196,28 +286,19 @@ class RecordButton(QAbstractButton):
         dot_y = h // 2 + text_offset
         dot_radius = 5
 
+        painter.setPen(Qt.PenStyle.NoPen)
         if self._recording:
-            # Animated red dot
-            dot_opacity = 0.7 + (self._pulse_value * 0.3)
-            dot_color = QColor(255, 100, 100)
-            dot_color.setAlphaF(dot_opacity)
-
-            # Subtle glow behind dot
+            # Subtle glow behind dot; the dot itself pulses, see paintEvent
             glow = QRadialGradient(dot_x, dot_y, dot_radius * 2)
-            glow.setColorAt(0, QColor(255, 100, 100, 60))
-            glow.setColorAt(1, QColor(255, 100, 100, 0))
+            glow.setStops(_DOT_GLOW_STOPS)
             painter.setBrush(QBrush(glow))
-            painter.setPen(Qt.PenStyle.NoPen)
             painter.drawEllipse(dot_x - dot_radius * 2, dot_y - dot_radius * 2,
                               dot_radius * 4, dot_radius * 4)
-
-            painter.setBrush(dot_color)
-            painter.drawEllipse(dot_x - dot_radius, dot_y - dot_radius,
-                              dot_radius * 2, dot_radius * 2)
         else:
             # Subtle green dot
-            dot_color = QColor(120, 180, 120, 180)
-            painter.setBrush(dot_color)
-            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(_IDLE_DOT_COLOR)
             painter.drawEllipse(dot_x - dot_radius, dot_y - dot_radius,
                               dot_radius * 2, dot_radius * 2)
+
+        painter.end()
+        return pixmap
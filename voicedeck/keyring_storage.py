@@ -7,10 +7,20 @@ KEY_NAME = "openai_api_key"
 
 _keyring_available = None
 
+# Resolved once by is_keyring_available(); backend discovery is slow
+_keyring_module = None
+_keyring_backend = None
+
+# Last key read from or written to the keyring. Startup, the main window
+# and the settings dialog all ask for it, and each backend lookup can be a
+# D-Bus round trip, so it is only read once per process.
+_MISSING = object()
+_cached_api_key = _MISSING
+
 
 def is_keyring_available() -> bool:
     """Check if system keyring is available."""
-    global _keyring_available
+    global _keyring_available, _keyring_module, _keyring_backend
     if _keyring_available is not None:
         return _keyring_available
 
@@ -21,6 +31,9 @@ def is_keyring_available() -> bool:
         # Check if we have a working backend (not the fail backend)
         backend = keyring.get_keyring()
         _keyring_available = not isinstance(backend, fail.Keyring)
+        if _keyring_available:
+            _keyring_module = keyring
+            _keyring_backend = backend
     except ImportError:
         _keyring_available = False
     except Exception:
@@ -36,12 +49,15 @@ def get_api_key() -> str | None:
     Returns:
         The API key if found, None otherwise.
     """
+    global _cached_api_key
     if not is_keyring_available():
         return None
+    if _cached_api_key is not _MISSING:
+        return _cached_api_key
 
     try:
-        import keyring
-        return keyring.get_password(SERVICE_NAME, KEY_NAME)
+        _cached_api_key = _keyring_backend.get_password(SERVICE_NAME, KEY_NAME)
+        return _cached_api_key
     except Exception as e:
         logging.debug(f"Failed to get API key from keyring: {e}")
         return None
@@ -57,12 +73,13 @@ def set_api_key(api_key: str) -> bool:
     Returns:
         True if successful, False otherwise.
     """
+    global _cached_api_key
     if not is_keyring_available():
         return False
 
     try:
-        import keyring
-        keyring.set_password(SERVICE_NAME, KEY_NAME, api_key)
+        _keyring_backend.set_password(SERVICE_NAME, KEY_NAME, api_key)
+        _cached_api_key = api_key
         return True
     except Exception as e:
         logging.debug(f"Failed to store API key in keyring: {e}")
@@ -76,15 +93,17 @@ def delete_api_key() -> bool:
     Returns:
         True if successful, False otherwise.
     """
+    global _cached_api_key
     if not is_keyring_available():
         return False
 
     try:
-        import keyring
-        keyring.delete_password(SERVICE_NAME, KEY_NAME)
+        _keyring_backend.delete_password(SERVICE_NAME, KEY_NAME)
+        _cached_api_key = None
         return True
-    except keyring.errors.PasswordDeleteError:
+    except _keyring_module.errors.PasswordDeleteError:
         # Key doesn't exist, that's fine
+        _cached_api_key = None
         return True
     except Exception as e:
         logging.debug(f"Failed to delete API key from keyring: {e}")
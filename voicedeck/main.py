@@ -4,19 +4,12 @@ import sys
 
 from PySide6.QtWidgets import QApplication, QMessageBox
 
-# Handle both package and direct execution
-try:
-    from voicedeck import __app_name__, __version__
-    from voicedeck.config import AppConfig
-    from voicedeck.gui import MainWindow
-    from voicedeck.stt.openai_client import create_transcriber, TranscriberError
-    from voicedeck.keyring_storage import get_api_key
-except ImportError:
-    from . import __app_name__, __version__
-    from .config import AppConfig
-    from .gui import MainWindow
-    from .stt.openai_client import create_transcriber, TranscriberError
-    from .keyring_storage import get_api_key
+from . import __app_name__, __version__
+from .config import AppConfig
+from .gui import MainWindow
+from .gui.styles import get_dark_stylesheet
+from .stt.openai_client import create_transcriber, TranscriberError
+from .keyring_storage import get_api_key
 
 
 def main():
@@ -26,6 +19,9 @@ def main():
     app.setApplicationName(__app_name__)
     app.setApplicationVersion(__version__)
 
+    # Style the whole application once rather than per window
+    app.setStyleSheet(get_dark_stylesheet())
+
     # Load configuration
     config = AppConfig.load()
 
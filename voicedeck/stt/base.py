@@ -1,7 +1,9 @@
 """Base interface for speech-to-text backends."""
 
+import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Optional
 
 
 class TranscriberError(Exception):
@@ -13,12 +15,17 @@ class Transcriber(ABC):
     """Abstract base class for speech-to-text transcribers."""
 
     @abstractmethod
-    def transcribe(self, file_path: Path) -> str:
+    def transcribe(
+        self, file_path: Path, cancelled: Optional[threading.Event] = None
+    ) -> str:
         """
         Transcribe an audio file to text.
 
         Args:
             file_path: Path to the audio file (WAV, FLAC, MP3, etc.)
+            cancelled: Event the caller sets to ask the call to stop early.
+                Backends check it between requests where they can; one that
+                ignores it runs to completion.
 
         Returns:
             The transcribed text.
@@ -1,18 +1,57 @@
 """OpenAI Speech-to-Text backend implementation."""
 
+import io
+import math
 import os
-import tempfile
+import re
+import threading
 import wave
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import numpy as np
-from openai import OpenAI, APIError, APIConnectionError, RateLimitError
-from scipy.io import wavfile
 
 from .base import Transcriber, TranscriberError
 from ..config import STTConfig
 
+if TYPE_CHECKING:
+    import openai
+
+# The openai SDK takes around half a second to import, so it is loaded on
+# the first transcription rather than while the window is starting up
+_openai = None
+
+
+def _get_openai():
+    """Import the openai SDK on first use and return the module."""
+    global _openai
+    if _openai is None:
+        import openai
+        _openai = openai
+    return _openai
+
+
+# Retries for a rate-limited request, doubling the delay each time
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF = 1.0  # seconds
+
+# Text transcribed twice because of the chunk overlap is looked for only
+# where the overlap can have put it: at most this many words per second of
+# overlap at the end of one transcript and the start of the next, give or
+# take a word cut off by the chunk edge on either side
+OVERLAP_WORDS_PER_SEC = 4
+OVERLAP_EDGE_WORDS = 1
+
+# The shortest repeat taken as the overlap rather than a coincidence, in
+# whole words and in letters, so a pair like "of the" is not enough
+MIN_OVERLAP_WORDS = 2
+MIN_OVERLAP_CHARS = 8
+
+_WORD = re.compile(r"\S+")
+_NOT_WORD_CHAR = re.compile(r"\W+")
+
 
 class OpenAITranscriber(Transcriber):
     """
@@ -23,9 +62,9 @@ class OpenAITranscriber(Transcriber):
 
     def __init__(self, config: STTConfig):
         self.config = config
-        self._client: Optional[OpenAI] = None
+        self._client: Optional["openai.OpenAI"] = None
 
-    def _get_client(self) -> OpenAI:
+    def _get_client(self) -> "openai.OpenAI":
         """Get or create the OpenAI client."""
         if self._client is None:
             api_key = self.config.api_key
@@ -39,7 +78,7 @@ class OpenAITranscriber(Transcriber):
             if self.config.base_url:
                 kwargs["base_url"] = self.config.base_url
 
-            self._client = OpenAI(**kwargs)
+            self._client = _get_openai().OpenAI(**kwargs)
 
         return self._client
 
@@ -56,7 +95,9 @@ class OpenAITranscriber(Transcriber):
             )
         return None
 
-    def transcribe(self, file_path: Path) -> str:
+    def transcribe(
+        self, file_path: Path, cancelled: Optional[threading.Event] = None
+    ) -> str:
         """
         Transcribe an audio file using OpenAI's API.
 
@@ -65,6 +106,7 @@ class OpenAITranscriber(Transcriber):
 
         Args:
             file_path: Path to the audio file.
+            cancelled: Set to stop before the next request is sent.
 
         Returns:
             The complete transcribed text.
@@ -72,109 +114,258 @@ class OpenAITranscriber(Transcriber):
         Raises:
             TranscriberError: If transcription fails.
         """
-        if not file_path.exists():
-            raise TranscriberError(f"Audio file not found: {file_path}")
+        if cancelled is None:
+            cancelled = threading.Event()
+        if cancelled.is_set():
+            raise TranscriberError("Transcription cancelled")
 
-        # Check if chunking is needed
-        file_size_mb = file_path.stat().st_size / (1024 * 1024)
-        duration_seconds = self._get_audio_duration(file_path)
+        path = os.fspath(file_path)
 
-        needs_chunking = (
-            file_size_mb > self.config.max_chunk_mb
-            or duration_seconds > self.config.max_chunk_seconds
-        )
-
-        if needs_chunking:
-            return self._transcribe_chunked(file_path, duration_seconds)
-        else:
-            return self._transcribe_single(file_path)
+        # One stat both checks the file exists and gives its size
+        try:
+            file_size_mb = os.stat(path).st_size / (1 << 20)
+        except FileNotFoundError:
+            raise TranscriberError(f"Audio file not found: {file_path}") from None
 
-    def _get_audio_duration(self, file_path: Path) -> float:
-        """Get duration of a WAV file in seconds."""
+        # Check if chunking is needed. The WAV header is parsed once, and the
+        # chunked path keeps reading from the same handle.
         try:
-            with wave.open(str(file_path), "rb") as wav:
-                frames = wav.getnframes()
-                rate = wav.getframerate()
-                return frames / rate
+            source = wave.open(path, "rb")
         except Exception as e:
             raise TranscriberError(f"Failed to read audio file: {e}") from e
 
-    def _transcribe_single(self, file_path: Path) -> str:
-        """Transcribe a single audio file."""
-        client = self._get_client()
+        with source:
+            duration_seconds = source.getnframes() / source.getframerate()
 
-        try:
-            with open(file_path, "rb") as audio_file:
-                response = client.audio.transcriptions.create(
-                    model=self.config.model,
-                    file=audio_file,
-                    response_format="text",
-                )
-            return response.strip() if isinstance(response, str) else response.text.strip()
-
-        except APIConnectionError as e:
-            raise TranscriberError(
-                "Failed to connect to OpenAI API. Check your internet connection."
-            ) from e
-        except RateLimitError as e:
-            raise TranscriberError(
-                "OpenAI API rate limit exceeded. Please wait and try again."
-            ) from e
-        except APIError as e:
-            raise TranscriberError(f"OpenAI API error: {e.message}") from e
-        except Exception as e:
-            raise TranscriberError(f"Transcription failed: {e}") from e
+            needs_chunking = (
+                file_size_mb > self.config.max_chunk_mb
+                or duration_seconds > self.config.max_chunk_seconds
+            )
+
+            if needs_chunking:
+                return self._transcribe_chunked(source, cancelled)
 
-    def _transcribe_chunked(self, file_path: Path, total_duration: float) -> str:
+        return self._transcribe_single(file_path, cancelled)
+
+    def _transcribe_single(
+        self, file_source: Path | tuple[str, bytes, str], cancelled: threading.Event
+    ) -> str:
+        """Transcribe an audio file, or an in-memory (filename, data, content type) upload."""
+        client = self._get_client()
+        openai = _get_openai()
+
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            try:
+                if isinstance(file_source, Path):
+                    upload = open(file_source, "rb")
+                else:
+                    upload = nullcontext(file_source)
+                with upload as audio_file:
+                    response = client.audio.transcriptions.create(
+                        model=self.config.model,
+                        file=audio_file,
+                        response_format="text",
+                    )
+                return response.strip() if isinstance(response, str) else response.text.strip()
+
+            except openai.APIConnectionError as e:
+                raise TranscriberError(
+                    "Failed to connect to OpenAI API. Check your internet connection."
+                ) from e
+            except openai.RateLimitError as e:
+                # Concurrent chunk uploads can trip the limit; back off and retry
+                delay = RATE_LIMIT_BACKOFF * 2 ** attempt
+                if attempt == RATE_LIMIT_RETRIES or cancelled.wait(delay):
+                    raise TranscriberError(
+                        "OpenAI API rate limit exceeded. Please wait and try again."
+                    ) from e
+            except openai.APIError as e:
+                raise TranscriberError(f"OpenAI API error: {e.message}") from e
+            except Exception as e:
+                raise TranscriberError(f"Transcription failed: {e}") from e
+
+    def _transcribe_chunk(self, chunk: bytes, cancelled: threading.Event) -> str:
+        """Transcribe one chunk, given as the bytes of a WAV file."""
+        if cancelled.is_set():
+            raise TranscriberError("Transcription cancelled")
+        return self._transcribe_single(("chunk.wav", chunk, "audio/wav"), cancelled)
+
+    def _transcribe_chunked(
+        self, source: wave.Wave_read, cancelled: threading.Event
+    ) -> str:
         """
         Transcribe a long audio file by splitting into chunks.
 
+        Up to ``parallel_chunks`` chunks are uploaded at the same time and
+        their transcripts are joined in recording order. Consecutive chunks
+        share ``chunk_overlap_sec`` of audio so words spanning a boundary
+        are heard whole, and the text repeated across it is dropped. Chunks
+        that never rise above ``silence_threshold`` are not uploaded.
+
         Args:
-            file_path: Path to the audio file.
-            total_duration: Total duration in seconds.
+            source: Open WAV file, read from its current position.
+            cancelled: Set to stop before the next chunk is uploaded.
 
         Returns:
             Concatenated transcript from all chunks.
         """
         chunk_duration = self.config.max_chunk_seconds
-        transcripts = []
+        workers = max(1, self.config.parallel_chunks)
 
-        # Read the full audio file
-        try:
-            sample_rate, audio_data = wavfile.read(str(file_path))
-        except Exception as e:
-            raise TranscriberError(f"Failed to read audio file: {e}") from e
+        # Create the client up front so the upload threads share it
+        self._get_client()
 
-        # Ensure audio is 1D (mono)
-        if len(audio_data.shape) > 1:
-            audio_data = audio_data[:, 0]
+        futures = []
+        pending = set()
+        pool = ThreadPoolExecutor(max_workers=workers)
+        try:
+            channels = source.getnchannels()
+            sample_width = source.getsampwidth()
+            sample_rate = source.getframerate()
+            samples_per_chunk = int(chunk_duration * sample_rate)
+
+            # Each chunk after the first starts with the end of the one before
+            # it; the overlap counts towards the chunk length so no upload
+            # grows past the configured limits
+            overlap_samples = min(
+                max(0, int(self.config.chunk_overlap_sec * sample_rate)),
+                samples_per_chunk // 2,
+            )
+            overlap = b""
+            silence_peak = int(self.config.silence_threshold * 32768)
 
-        samples_per_chunk = int(chunk_duration * sample_rate)
-        total_samples = len(audio_data)
-        num_chunks = (total_samples + samples_per_chunk - 1) // samples_per_chunk
+            # Stream the file one chunk at a time rather than loading it whole
+            while True:
+                if cancelled.is_set():
+                    raise TranscriberError("Transcription cancelled")
 
-        for i in range(num_chunks):
-            start_sample = i * samples_per_chunk
-            end_sample = min((i + 1) * samples_per_chunk, total_samples)
-            chunk_data = audio_data[start_sample:end_sample]
+                frames = source.readframes(
+                    samples_per_chunk - len(overlap) // sample_width
+                )
+                if not frames:
+                    break
+
+                # Ensure audio is mono
+                if channels > 1:
+                    frames = _first_channel(frames, channels, sample_width)
+
+                # Silence transcribes to nothing, so don't spend a request on
+                # it. Only the new audio is checked, as the overlap went out
+                # with the previous chunk, and only for 16-bit audio, which is
+                # what the recorder writes.
+                silent = (
+                    sample_width == 2 and _peak_amplitude(frames) < silence_peak
+                )
 
-            # Write chunk to temporary file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
-                chunk_path = Path(tmp_file.name)
+                # The next chunk only repeats this one's audio if this one
+                # is uploaded
+                if silent:
+                    overlap = b""
+                    continue
+
+                overlapped = bool(overlap)
+                frames = overlap + frames
+                if overlap_samples:
+                    overlap = frames[-overlap_samples * sample_width:]
+
+                # Encode the chunk in memory and upload it from there
+                chunk = _encode_wav(frames, sample_width, sample_rate)
+                future = pool.submit(self._transcribe_chunk, chunk, cancelled)
+                futures.append((future, overlapped))
+                pending.add(future)
+
+                # Upload several chunks at once, but only read ahead (and hold
+                # chunks in memory) as far as there are free workers; stop
+                # early if one has failed
+                if len(pending) >= workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+
+            transcripts = [(f.result(), overlapped) for f, overlapped in futures]
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        # Deduplicate only across a boundary whose audio really overlapped,
+        # i.e. the chunk before was uploaded and something was heard in it
+        text = ""
+        previous = ""
+        for transcript, overlapped in transcripts:
+            if transcript:
+                if overlapped and previous:
+                    text = _join_overlapping(
+                        text, transcript, self.config.chunk_overlap_sec
+                    )
+                else:
+                    text = f"{text} {transcript}" if text else transcript
+            previous = transcript
+        return text
+
+
+def _first_channel(frames: bytes, channels: int, sample_width: int) -> bytes:
+    """Extract the first channel from interleaved PCM frames."""
+    # One opaque item per sample keeps the slice a single strided copy, and
+    # still works for widths NumPy has no integer type for (24-bit)
+    samples = np.frombuffer(frames, dtype=np.dtype((np.void, sample_width)))
+    return samples.reshape(-1, channels)[:, 0].tobytes()
+
+
+def _peak_amplitude(frames: bytes) -> int:
+    """Return the largest absolute sample value in 16-bit PCM frames."""
+    samples = np.frombuffer(frames, dtype=np.int16)
+    # Taken from max and min rather than np.abs, which overflows on -32768
+    return max(int(samples.max()), -int(samples.min()))
+
+
+def _join_overlapping(previous: str, current: str, overlap_sec: float) -> str:
+    """
+    Join the transcripts of overlapping chunks, dropping the repeated text.
 
-            try:
-                wavfile.write(str(chunk_path), sample_rate, chunk_data)
-                transcript = self._transcribe_single(chunk_path)
-                if transcript:
-                    transcripts.append(transcript)
-            finally:
-                # Clean up temporary chunk file
-                try:
-                    chunk_path.unlink()
-                except Exception:
-                    pass
-
-        return " ".join(transcripts)
+    The repeat must end ``previous`` and begin ``current``, allowing for a
+    word cut off by the chunk edge on either side. Anything else is joined
+    as it is: a repeat left in is easy to spot, speech dropped is not.
+    """
+    previous_words = [(m.start(), _normalize_word(m.group()))
+                      for m in _WORD.finditer(previous)]
+    current_words = [(m.start(), _normalize_word(m.group()))
+                     for m in _WORD.finditer(current)]
+    longest = math.ceil(overlap_sec * OVERLAP_WORDS_PER_SEC)
+
+    # Look for the longest repeat first
+    for size in range(longest, MIN_OVERLAP_WORDS - 1, -1):
+        for previous_edge in range(OVERLAP_EDGE_WORDS + 1):
+            end = len(previous_words) - previous_edge
+            if end < size:
+                continue
+            tail = [word for _, word in previous_words[end - size:end]]
+            if sum(map(len, tail)) < MIN_OVERLAP_CHARS:
+                continue
+            for current_edge in range(OVERLAP_EDGE_WORDS + 1):
+                head = current_words[current_edge:current_edge + size]
+                if [word for _, word in head] == tail:
+                    # Keep the previous chunk's copy, except for the last
+                    # word, which the current one has with what follows it
+                    kept = previous[:previous_words[end - 1][0]]
+                    return kept + current[head[-1][0]:]
+
+    return f"{previous} {current}"
+
+
+def _normalize_word(word: str) -> str:
+    """Lower-case a word and drop its punctuation, for comparing chunk edges."""
+    # Chunks often differ in case and punctuation at their edges
+    return _NOT_WORD_CHAR.sub("", word.lower())
+
+
+def _encode_wav(frames: bytes, sample_width: int, sample_rate: int) -> bytes:
+    """Wrap mono PCM frames in a WAV container."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as chunk:
+        chunk.setnchannels(1)
+        chunk.setsampwidth(sample_width)
+        chunk.setframerate(sample_rate)
+        chunk.writeframes(frames)
+    return buffer.getvalue()
 
 
 def create_transcriber(config: STTConfig) -> Transcriber: